@@ -3,6 +3,7 @@ Main execution script for Data Quality Framework
 Run this script to perform data quality validation on financial transaction data
 """
 
+import logging
 import sys
 import os
 import pandas as pd
@@ -13,7 +14,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.data_quality_framework import DataQualityFramework
 from src.report_generator import DataQualityReportGenerator
-from src.utils import generate_sample_data, create_directory_if_not_exists
+from src.utils import generate_sample_data, create_directory_if_not_exists, load_transactions_csv
 
 
 def main():
@@ -43,7 +44,7 @@ def main():
     
     # Load the transaction data
     try:
-        df = pd.read_csv(sample_data_path)
+        df = load_transactions_csv(sample_data_path)
         print(f"✓ Loaded {len(df)} transactions for validation")
     except Exception as e:
         print(f"❌ Error loading data: {e}")
@@ -101,6 +102,9 @@ def main():
 
 
 if __name__ == "__main__":
+    # Framework progress messages are logged at INFO; only show warnings and errors
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    
     try:
         results = main()
     except KeyboardInterrupt:
@@ -3,14 +3,14 @@ Enhanced Data Quality Framework Main Script with Azure SQL Database Support
 Run this script to execute the complete data quality validation process
 """
 
-import pandas as pd
 import argparse
+import logging
 import os
-import sys
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from src.data_quality_framework import DataQualityFramework
 from src.report_generator import DataQualityReportGenerator
-from src.utils import generate_sample_data
+from src.utils import generate_sample_data, iter_transactions_csv, DEFAULT_CHUNKSIZE
 
 def main():
     """Main execution function with command line arguments"""
@@ -24,9 +24,18 @@ def main():
                        help='Limit number of records to process')
     parser.add_argument('--config-azure', action='store_true',
                        help='Test Azure SQL Database configuration')
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                       help='Number of CSV rows to validate per chunk')
+    parser.add_argument('--sync', action='store_true',
+                       help='Save results and generate reports one after another (for debugging)')
+    parser.add_argument('--verbose', '-v', action='count', default=0,
+                       help='Show framework progress messages (-vv for per-check debug output)')
     
     args = parser.parse_args()
     
+    levels = [logging.WARNING, logging.INFO, logging.DEBUG]
+    logging.basicConfig(level=levels[min(args.verbose, 2)], format="%(message)s")
+    
     print("🚀 Starting Data Quality Framework for Financial Data")
     print("=" * 60)
     
@@ -43,63 +52,75 @@ def main():
         return
     
     # Load data based on source type
+    df = None
     if args.data_source == 'azure-sql' or args.azure_sql:
         print("📡 Loading data from Azure SQL Database...")
         df = framework.load_data_from_azure(limit=args.limit)
         
         if df is None:
             print("⚠️ Failed to load from Azure SQL, falling back to CSV...")
-            df = load_csv_data()
     else:
         print("📁 Loading data from CSV file...")
-        df = load_csv_data()
-    
-    if df is None or df.empty:
-        print("❌ No data available for validation")
-        return
-    
-    print(f"✓ Loaded {len(df)} transactions for validation")
     
     # Run validation
     print("\n🔍 Running Data Quality Validations...")
     print("-" * 40)
     
-    results = framework.run_all_validations(df)
+    if df is not None:
+        print(f"✓ Loaded {len(df)} transactions for validation")
+        # A limited sample is a one-off, don't cache it
+        results = framework.run_all_validations(df, use_cache=args.limit is None)
+    else:
+        # Stream the CSV so only one chunk is held in memory at a time
+        results = framework.run_chunked_validations(lambda: load_csv_data(args.chunksize))
+    
+    if framework.summary_stats["total_input_records"] == 0:
+        print("❌ No data available for validation")
+        return
     
     # Display results
     display_results(framework, results)
     
-    # Save failed records
+    # Saving results is disk/network bound, so run the saves on worker threads
+    # while the reports are generated here on the main thread
     print("\n💾 Saving failed records for inspection...")
-    framework.save_failed_records()
+    save_tasks = [framework.save_failed_records]
     
     # Save quality report to Azure SQL if enabled
     if args.azure_sql:
-        framework.save_quality_report()
+        save_tasks.append(framework.save_quality_report)
     
-    # Generate reports
+    if args.sync:
+        for task in save_tasks:
+            task()
+        report_path = generate_reports(results)
+    else:
+        with ThreadPoolExecutor(max_workers=len(save_tasks)) as executor:
+            futures = [executor.submit(task) for task in save_tasks]
+            report_path = generate_reports(results)
+            wait(futures)
+        for future in futures:
+            future.result()
+    
+    if report_path:
+        # Display key metrics
+        display_key_metrics(framework, report_path)
+    
+    print("\n✅ Data Quality Framework execution completed!")
+
+def generate_reports(results):
+    """Generate the weekly reports, returning the report path or None if generation failed"""
     print("\n📋 Generating Data Quality Reports...")
     print("-" * 40)
     
     try:
         report_generator = DataQualityReportGenerator()
-        
-        # Generate reports
-        report_files = report_generator.generate_weekly_report(
-            validation_summary=framework.get_validation_summary(),
-            overall_stats=framework.summary_stats,
-            failed_records=framework.failed_records
-        )
-        
+        report_path = report_generator.generate_weekly_report(results)
         print("✓ Reports generated successfully!")
-        
-        # Display key metrics
-        display_key_metrics(framework, report_files)
-        
+        return report_path
     except Exception as e:
         print(f"⚠️ Report generation failed: {e}")
-    
-    print("\n✅ Data Quality Framework execution completed!")
+        return None
 
 def test_azure_configuration():
     """Test Azure SQL Database configuration"""
@@ -137,8 +158,8 @@ def test_azure_configuration():
     except Exception as e:
         print(f"❌ Configuration test failed: {e}")
 
-def load_csv_data():
-    """Load data from CSV file, generate sample if not exists"""
+def load_csv_data(chunksize: int = DEFAULT_CHUNKSIZE):
+    """Stream data from CSV file in chunks, generate sample if not exists"""
     data_file = "data/sample_transactions.csv"
     
     if not os.path.exists(data_file):
@@ -150,11 +171,12 @@ def load_csv_data():
         sample_df.to_csv(data_file, index=False)
         print(f"✓ Generated {len(sample_df)} sample transactions")
     
-    return pd.read_csv(data_file)
+    return iter_transactions_csv(data_file, chunksize)
 
 def display_results(framework, results):
     """Display validation results"""
-    print(f"\nStarting data quality validation for {results['total_input_records']} records...")
+    stats = results["summary_stats"]
+    print(f"\nStarting data quality validation for {stats['total_input_records']} records...")
     
     validation_order = [
         'mandatory_fields', 'amount_range', 'currency_codes',
@@ -165,16 +187,16 @@ def display_results(framework, results):
         if check in framework.validation_results:
             print(f"✓ Checking {check.replace('_', ' ')}...")
     
-    print(f"✓ Validation complete! {results['total_passed_records']} records passed all checks.")
+    print(f"✓ Validation complete! {stats['total_passed_records']} records passed all checks.")
     
     # Print summary
     print("\n" + "=" * 80)
     print("DATA QUALITY VALIDATION SUMMARY")
     print("=" * 80)
-    print(f"📊 Total Input Records: {results['total_input_records']:,}")
-    print(f"✅ Passed Records: {results['total_passed_records']:,}")
-    print(f"❌ Failed Records: {results['total_failed_records']:,}")
-    print(f"📈 Overall Pass Rate: {results['overall_pass_rate']:.2%}")
+    print(f"📊 Total Input Records: {stats['total_input_records']:,}")
+    print(f"✅ Passed Records: {stats['total_passed_records']:,}")
+    print(f"❌ Failed Records: {stats['total_failed_records']:,}")
+    print(f"📈 Overall Pass Rate: {stats['overall_pass_rate']:.2%}")
     print(f"🏆 Quality Status: {framework.summary_stats['quality_status']}")
     print(f"⏰ Validation Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
@@ -3,6 +3,7 @@ Azure SQL Database Setup and Configuration Script
 Run this script to set up your Azure SQL Database for the Data Quality Framework
 """
 
+import getpass
 import json
 import os
 from src.azure_sql_connector import AzureSQLConnector
@@ -26,11 +27,12 @@ def setup_azure_sql():
     print("\n📝 Please provide your Azure SQL Database details:")
     print("-" * 50)
     
-    # Collect configuration details
-    server = input("Azure SQL Server (e.g., your-server.database.windows.net): ").strip()
-    database = input("Database name: ").strip()
-    username = input("Username: ").strip()
-    password = input("Password: ").strip()
+    # Collect configuration details, prompting only for values not set in the environment
+    server = os.environ.get('AZURE_SQL_SERVER') or input("Azure SQL Server (e.g., your-server.database.windows.net): ").strip()
+    database = os.environ.get('AZURE_SQL_DATABASE') or input("Database name: ").strip()
+    username = os.environ.get('AZURE_SQL_USERNAME') or input("Username: ").strip()
+    password_from_env = bool(os.environ.get('AZURE_SQL_PASSWORD'))
+    password = os.environ.get('AZURE_SQL_PASSWORD') or getpass.getpass("Password: ").strip()
     
     # Create configuration
     config = {
@@ -49,16 +51,26 @@ def setup_azure_sql():
             "quality_reports_table": "data_quality_reports"
         },
         "batch_size": 1000,
+        "pool_size": 5,
+        "use_bcp": False,
+        "bcp_threshold": 50000,
         "use_azure_sql": True,
         "fallback_to_csv": True
     }
     
+    # Keep the password out of the config file when it is supplied by the environment;
+    # the connector reads AZURE_SQL_PASSWORD when it builds the connection string
+    if password_from_env:
+        del config["azure_sql"]["password"]
+    
     # Save configuration
     os.makedirs("config", exist_ok=True)
     with open(config_file, 'w') as f:
         json.dump(config, f, indent=4)
     
     print(f"\n✅ Configuration saved to {config_file}")
+    if password_from_env:
+        print("🔑 Password not stored; it will be read from AZURE_SQL_PASSWORD")
     
     # Test connection
     test_connection()
@@ -139,7 +151,7 @@ def show_sample_data_upload():
     print("1. Run the framework with CSV data first:")
     print("   python run_quality_checks.py")
     print("2. Then import the CSV data to Azure SQL:")
-    print("   python -c \"from src.azure_sql_connector import AzureSQLConnector; import pandas as pd; df=pd.read_csv('data/sample_transactions.csv'); connector=AzureSQLConnector(); connector.connect(); df.to_sql('transactions', connector.connection, if_exists='append', index=False)\"")
+    print("   python -c \"from src.azure_sql_connector import AzureSQLConnector; import pandas as pd; df=pd.read_csv('data/sample_transactions.csv'); connector=AzureSQLConnector(); df.to_sql('transactions', connector.engine, if_exists='append', index=False)\"")
 
 if __name__ == "__main__":
     print("🎯 Welcome to Azure SQL Database Setup!")
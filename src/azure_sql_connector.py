@@ -4,13 +4,16 @@ Handles connections, data retrieval, and storage operations with Azure SQL Datab
 """
 
 import pandas as pd
-import pyodbc
 import json
 import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from urllib.parse import quote_plus
 import os
 
+# Database drivers (pyodbc, sqlalchemy, turbodbc) are imported where they are
+# used, so importing this module stays cheap
+
 class AzureSQLConnector:
     """
     Azure SQL Database connector for the Data Quality Framework
@@ -23,9 +26,10 @@ class AzureSQLConnector:
         Args:
             config_path: Path to Azure SQL configuration file
         """
+        self.logger = logging.getLogger(__name__)
         self.config = self._load_config(config_path)
         self.connection = None
-        self.logger = logging.getLogger(__name__)
+        self.engine = self._create_engine()
         
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load Azure SQL configuration from JSON file"""
@@ -39,29 +43,51 @@ class AzureSQLConnector:
             self.logger.error(f"Invalid JSON in configuration file: {config_path}")
             raise
     
+    def _build_connection_string(self) -> str:
+        """Build the ODBC connection string from configuration"""
+        azure_config = self.config['azure_sql']
+        
+        return (
+            f"DRIVER={azure_config['driver']};"
+            f"SERVER={azure_config['server']};"
+            f"DATABASE={azure_config['database']};"
+            f"UID={azure_config['username']};"
+            f"PWD={self._password()};"
+            f"Encrypt=yes;"
+            f"TrustServerCertificate=no;"
+            f"Connection Timeout={azure_config['connection_timeout']};"
+        )
+    
+    def _password(self) -> str:
+        """Return the database password, preferring the AZURE_SQL_PASSWORD environment variable"""
+        return os.environ.get('AZURE_SQL_PASSWORD') or self.config['azure_sql'].get('password', '')
+    
+    def _create_engine(self):
+        """
+        Create the pooled SQLAlchemy engine shared by all database operations
+        
+        Pooled connections keep the TLS session and login alive between calls, and
+        fast_executemany lets pyodbc send each insert batch as a single round-trip.
+        No connection is opened until the engine is first used.
+        """
+        from sqlalchemy import create_engine
+        
+        return create_engine(
+            f"mssql+pyodbc:///?odbc_connect={quote_plus(self._build_connection_string())}",
+            pool_size=self.config.get('pool_size', 5),
+            pool_pre_ping=True,
+            fast_executemany=True
+        )
+    
     def connect(self) -> bool:
         """
-        Establish connection to Azure SQL Database
+        Check out a raw DBAPI connection from the pool into self.connection
         
         Returns:
             bool: True if connection successful, False otherwise
         """
         try:
-            azure_config = self.config['azure_sql']
-            
-            # Build connection string
-            connection_string = (
-                f"DRIVER={azure_config['driver']};"
-                f"SERVER={azure_config['server']};"
-                f"DATABASE={azure_config['database']};"
-                f"UID={azure_config['username']};"
-                f"PWD={azure_config['password']};"
-                f"Encrypt=yes;"
-                f"TrustServerCertificate=no;"
-                f"Connection Timeout={azure_config['connection_timeout']};"
-            )
-            
-            self.connection = pyodbc.connect(connection_string)
+            self.connection = self.engine.raw_connection()
             self.logger.info("Successfully connected to Azure SQL Database")
             return True
             
@@ -70,11 +96,17 @@ class AzureSQLConnector:
             return False
     
     def disconnect(self):
-        """Close the database connection"""
+        """Return the checked-out connection to the pool"""
         if self.connection:
             self.connection.close()
+            self.connection = None
             self.logger.info("Disconnected from Azure SQL Database")
     
+    def close(self):
+        """Close all pooled connections"""
+        self.disconnect()
+        self.engine.dispose()
+    
     def test_connection(self) -> bool:
         """
         Test the database connection
@@ -83,14 +115,14 @@ class AzureSQLConnector:
             bool: True if connection test successful
         """
         try:
-            if not self.connect():
-                return False
+            import pyodbc
             
-            # Simple test query
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT 1 as test")
-            result = cursor.fetchone()
-            cursor.close()
+            # Ask the driver for the DBMS name; this proves the login without running a query
+            connection = self.engine.raw_connection()
+            try:
+                connection.driver_connection.getinfo(pyodbc.SQL_DBMS_NAME)
+            finally:
+                connection.close()
             
             self.logger.info("Azure SQL Database connection test successful")
             return True
@@ -98,8 +130,6 @@ class AzureSQLConnector:
         except Exception as e:
             self.logger.error(f"Connection test failed: {str(e)}")
             return False
-        finally:
-            self.disconnect()
     
     def load_transactions(self, query: Optional[str] = None, limit: Optional[int] = None) -> pd.DataFrame:
         """
@@ -113,19 +143,25 @@ class AzureSQLConnector:
             pd.DataFrame: Transaction data
         """
         try:
-            if not self.connect():
-                raise Exception("Failed to connect to database")
-            
             # Default query if none provided
             if query is None:
                 table_name = self.config['tables']['transactions_table']
-                query = f"SELECT transaction_id, account_id, amount, currency, timestamp FROM {table_name}"
-                
-                if limit:
-                    query += f" TOP {limit}"
+                top_clause = f"TOP {int(limit)} " if limit else ""
+                query = f"SELECT {top_clause}transaction_id, account_id, amount, currency, timestamp FROM {table_name}"
             
-            # Load data using pandas
-            df = pd.read_sql(query, self.connection)
+            try:
+                df = self._read_sql_arrow(query)
+            except Exception as e:
+                self.logger.warning(f"turbodbc fetch failed, falling back to pyodbc: {str(e)}")
+                df = None
+            
+            if df is None:
+                from sqlalchemy import text
+                
+                # Load data using pandas, fetching batch_size rows at a time
+                with self.engine.connect() as conn:
+                    chunks = list(pd.read_sql(text(query), conn, chunksize=self.config['batch_size']))
+                df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
             self.logger.info(f"Loaded {len(df)} transactions from Azure SQL Database")
             
             return df
@@ -133,8 +169,32 @@ class AzureSQLConnector:
         except Exception as e:
             self.logger.error(f"Failed to load transactions: {str(e)}")
             raise
+    
+    def _read_sql_arrow(self, query: str) -> Optional[pd.DataFrame]:
+        """
+        Run a query through turbodbc and fetch the result as a single Arrow table
+        
+        Args:
+            query: SQL query to execute
+            
+        Returns:
+            pd.DataFrame or None: Query result, or None if turbodbc is not installed
+        """
+        try:
+            import turbodbc
+        except ImportError:
+            return None
+        
+        connection = turbodbc.connect(connection_string=self._build_connection_string())
+        try:
+            cursor = connection.cursor()
+            cursor.execute(query)
+            table = cursor.fetchallarrow()
+            cursor.close()
         finally:
-            self.disconnect()
+            connection.close()
+        
+        return table.to_pandas()
     
     def save_failed_records(self, failed_df: pd.DataFrame, validation_type: str) -> bool:
         """
@@ -150,28 +210,25 @@ class AzureSQLConnector:
         try:
             if failed_df.empty:
                 return True
-                
-            if not self.connect():
-                return False
             
-            # Add metadata columns
-            failed_df = failed_df.copy()
-            failed_df['validation_type'] = validation_type
-            failed_df['failed_at'] = datetime.now()
-            failed_df['status'] = 'FAILED'
+            # Add metadata columns; failed_at is filled in by the server default
+            failed_df = failed_df.assign(validation_type=validation_type, status='FAILED')
             
             # Save to failed records table
             table_name = self.config['tables']['failed_records_table']
             
-            # Use to_sql with pyodbc connection
-            failed_df.to_sql(
-                name=table_name,
-                con=self.connection,
-                if_exists='append',
-                index=False,
-                method='multi',
-                chunksize=self.config['batch_size']
-            )
+            if self._use_bulk_copy(len(failed_df)):
+                self._bulk_insert(failed_df, table_name)
+            else:
+                # Insert all batches in a single transaction
+                with self.engine.begin() as conn:
+                    failed_df.to_sql(
+                        name=table_name,
+                        con=conn,
+                        if_exists='append',
+                        index=False,
+                        chunksize=self.config['batch_size']
+                    )
             
             self.logger.info(f"Saved {len(failed_df)} failed records to Azure SQL Database")
             return True
@@ -179,8 +236,39 @@ class AzureSQLConnector:
         except Exception as e:
             self.logger.error(f"Failed to save failed records: {str(e)}")
             return False
-        finally:
-            self.disconnect()
+    
+    def _use_bulk_copy(self, num_rows: int) -> bool:
+        """Check whether an insert is large enough to go through the bcp utility"""
+        if not self.config.get('use_bcp', False):
+            return False
+        if num_rows <= self.config.get('bcp_threshold', 50000):
+            return False
+        
+        try:
+            import bcpandas  # noqa: F401
+        except ImportError:
+            self.logger.warning("use_bcp is enabled but bcpandas is not installed, using SQLAlchemy inserts")
+            return False
+        return True
+    
+    def _bulk_insert(self, df: pd.DataFrame, table_name: str):
+        """
+        Append a DataFrame to a table with the bcp bulk copy utility
+        
+        Args:
+            df: DataFrame to insert
+            table_name: Target table name
+        """
+        from bcpandas import SqlCreds, to_sql
+        
+        azure_config = self.config['azure_sql']
+        creds = SqlCreds(
+            azure_config['server'],
+            azure_config['database'],
+            azure_config['username'],
+            self._password()
+        )
+        to_sql(df, table_name, creds, index=False, if_exists='append', batch_size=100000)
     
     def save_quality_report(self, report_data: Dict[str, Any]) -> bool:
         """
@@ -193,9 +281,6 @@ class AzureSQLConnector:
             bool: True if save successful
         """
         try:
-            if not self.connect():
-                return False
-            
             # Prepare report data
             report_df = pd.DataFrame([{
                 'report_date': datetime.now(),
@@ -210,12 +295,13 @@ class AzureSQLConnector:
             # Save to quality reports table
             table_name = self.config['tables']['quality_reports_table']
             
-            report_df.to_sql(
-                name=table_name,
-                con=self.connection,
-                if_exists='append',
-                index=False
-            )
+            with self.engine.begin() as conn:
+                report_df.to_sql(
+                    name=table_name,
+                    con=conn,
+                    if_exists='append',
+                    index=False
+                )
             
             self.logger.info("Saved quality report to Azure SQL Database")
             return True
@@ -223,8 +309,6 @@ class AzureSQLConnector:
         except Exception as e:
             self.logger.error(f"Failed to save quality report: {str(e)}")
             return False
-        finally:
-            self.disconnect()
     
     def create_tables(self) -> bool:
         """
@@ -234,15 +318,10 @@ class AzureSQLConnector:
             bool: True if tables created successfully
         """
         try:
-            if not self.connect():
-                return False
-            
-            cursor = self.connection.cursor()
-            
             # Create transactions table (if needed)
             transactions_table = self.config['tables']['transactions_table']
             create_transactions_sql = f"""
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='{transactions_table}' AND xtype='U')
+            IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = '{transactions_table}')
             CREATE TABLE {transactions_table} (
                 transaction_id NVARCHAR(50) PRIMARY KEY,
                 account_id NVARCHAR(50) NOT NULL,
@@ -256,7 +335,7 @@ class AzureSQLConnector:
             # Create failed records table
             failed_table = self.config['tables']['failed_records_table']
             create_failed_sql = f"""
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='{failed_table}' AND xtype='U')
+            IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = '{failed_table}')
             CREATE TABLE {failed_table} (
                 id INT IDENTITY(1,1) PRIMARY KEY,
                 transaction_id NVARCHAR(50),
@@ -265,16 +344,24 @@ class AzureSQLConnector:
                 currency NVARCHAR(3),
                 timestamp DATETIME,
                 validation_type NVARCHAR(50),
-                failed_at DATETIME,
+                failed_at DATETIME DEFAULT SYSUTCDATETIME(),
                 status NVARCHAR(20),
                 created_at DATETIME DEFAULT GETDATE()
             )
             """
             
+            # Tables created before failed_at had a default need it added
+            add_failed_at_default_sql = f"""
+            IF NOT EXISTS (SELECT * FROM sys.default_constraints
+                           WHERE parent_object_id = OBJECT_ID('{failed_table}')
+                           AND COL_NAME(parent_object_id, parent_column_id) = 'failed_at')
+            ALTER TABLE {failed_table} ADD DEFAULT SYSUTCDATETIME() FOR failed_at
+            """
+            
             # Create quality reports table
             reports_table = self.config['tables']['quality_reports_table']
             create_reports_sql = f"""
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='{reports_table}' AND xtype='U')
+            IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = '{reports_table}')
             CREATE TABLE {reports_table} (
                 id INT IDENTITY(1,1) PRIMARY KEY,
                 report_date DATETIME NOT NULL,
@@ -288,13 +375,15 @@ class AzureSQLConnector:
             )
             """
             
-            # Execute table creation
-            cursor.execute(create_transactions_sql)
-            cursor.execute(create_failed_sql)
-            cursor.execute(create_reports_sql)
-            
-            self.connection.commit()
-            cursor.close()
+            # Execute table creation as a single batch (one round-trip)
+            create_all_sql = ";\n".join([
+                create_transactions_sql,
+                create_failed_sql,
+                add_failed_at_default_sql,
+                create_reports_sql
+            ])
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql(create_all_sql)
             
             self.logger.info("Successfully created/verified Azure SQL Database tables")
             return True
@@ -302,8 +391,6 @@ class AzureSQLConnector:
         except Exception as e:
             self.logger.error(f"Failed to create tables: {str(e)}")
             return False
-        finally:
-            self.disconnect()
 
 # Example usage and configuration
 if __name__ == "__main__":
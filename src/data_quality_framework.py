@@ -4,26 +4,134 @@ Orchestrates all validation checks and manages results with Azure SQL Database s
 """
 
 import pandas as pd
+import numpy as np
+import contextlib
+import hashlib
+import itertools
 import json
+import logging
 import os
+import pickle
+import tempfile
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Tuple, Optional
+from functools import partial
+from typing import Dict, List, Any, Tuple, Optional, Callable, Iterable
 from src.validators import (
-    validate_non_null_fields,
-    validate_amount_range,
-    validate_currency_codes,
-    validate_duplicate_transactions,
-    validate_timestamp_format,
-    validate_account_id_format
+    VALIDATION_CHECKS,
+    evaluate_checks,
+    duplicate_candidates,
+    select_failed_positions,
+    take_failure_values
 )
-from src.utils import load_config, save_failed_records, create_directory_if_not_exists
+from src.utils import (
+    load_config,
+    resolve_failed_records_format,
+    write_failed_records_file,
+    create_directory_if_not_exists,
+    optimize_transaction_dtypes,
+    DEFAULT_MAX_WORKERS,
+    PYARROW_AVAILABLE
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Layout version of validation cache entries, part of every cache key
+_CACHE_FORMAT_VERSION = 3
 
-# Azure SQL connector import (optional)
-try:
-    from src.azure_sql_connector import AzureSQLConnector
-    AZURE_SQL_AVAILABLE = True
-except ImportError:
-    AZURE_SQL_AVAILABLE = False
+# Column holding the original row labels of spilled failed records
+_SPILLED_INDEX_COLUMN = "__row_index__"
+
+
+class FailedRecords(Mapping):
+    """
+    Failed records by validation check, built when a check's records are read
+    
+    A check stores the row positions of its failures in the validated frame (or,
+    when chunk results are merged, the paths of Feather files they were spilled
+    to), so its records are only materialized by the consumer reading them, one
+    check at a time.
+    """
+    
+    def __init__(self, run_timestamp: str):
+        """
+        Args:
+            run_timestamp: Validation run timestamp every record is tagged with
+        """
+        self.run_timestamp = run_timestamp
+        self._parts: Dict[str, List[Any]] = {}
+        # Created on the first spill and removed along with this mapping
+        self._spill_dir: Optional[tempfile.TemporaryDirectory] = None
+    
+    def add_positions(self, check_name: str, df: pd.DataFrame, positions: np.ndarray,
+                      failure_reason: Any, failed_fields: Any):
+        """Add the failures of check_name at positions of df (annotations as from take_failure_values)"""
+        self._parts.setdefault(check_name, []).append((df, positions, failure_reason, failed_fields))
+    
+    def add_frame(self, check_name: str, failed_df: pd.DataFrame):
+        """Add already selected, untagged failed records of check_name"""
+        self._parts.setdefault(check_name, []).append(failed_df)
+    
+    def spill(self, check_name: str, failed_df: pd.DataFrame):
+        """
+        Add untagged failed records of check_name, written to a Feather file
+        
+        Only the file path is kept in memory. Without pyarrow the records are
+        kept as they are.
+        """
+        if not PYARROW_AVAILABLE:
+            self.add_frame(check_name, failed_df)
+            return
+        
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory(prefix="dq_failed_records_")
+        parts = self._parts.setdefault(check_name, [])
+        path = os.path.join(self._spill_dir.name, f"{check_name}_{len(parts)}.feather")
+        failed_df.reset_index(names=_SPILLED_INDEX_COLUMN).to_feather(path)
+        parts.append(path)
+    
+    def untagged(self, check_name: str) -> pd.DataFrame:
+        """Materialize a check's failed records without the validation_check/validation_timestamp tags"""
+        frames = [self._materialize(part) for part in self._parts[check_name]]
+        return frames[0] if len(frames) == 1 else pd.concat(frames)
+    
+    @staticmethod
+    def _materialize(part: Any) -> pd.DataFrame:
+        """Build the failed records of one stored part"""
+        if isinstance(part, pd.DataFrame):
+            return part
+        if isinstance(part, str):
+            return pd.read_feather(part).set_index(_SPILLED_INDEX_COLUMN).rename_axis(index=None)
+        return select_failed_positions(*part)
+    
+    def to_positions(self) -> Dict[str, Tuple[np.ndarray, Any, Any]]:
+        """Row positions and failure annotations of every check, for single-frame results"""
+        positions = {}
+        for check_name, parts in self._parts.items():
+            (_, check_positions, failure_reason, failed_fields), = parts
+            positions[check_name] = (check_positions, failure_reason, failed_fields)
+        return positions
+    
+    def __getitem__(self, check_name: str) -> pd.DataFrame:
+        failed_df = self.untagged(check_name)
+        # Both tags are single-category columns so each value is stored once
+        codes = np.zeros(len(failed_df), dtype=np.int8)
+        return failed_df.assign(
+            validation_check=pd.Categorical.from_codes(codes, categories=[check_name]),
+            validation_timestamp=pd.Categorical.from_codes(codes, categories=[self.run_timestamp])
+        )
+    
+    def __contains__(self, check_name: object) -> bool:
+        # Mapping's default would build the records just to test membership
+        return check_name in self._parts
+    
+    def __iter__(self):
+        return iter(self._parts)
+    
+    def __len__(self) -> int:
+        return len(self._parts)
 
 
 class DataQualityFramework:
@@ -41,132 +149,344 @@ class DataQualityFramework:
             use_azure_sql: Whether to use Azure SQL Database integration
         """
         self.config = load_config(config_path)
+        
+        # Pass rate bounds of the WARNING and EXCELLENT quality statuses
+        thresholds = self.config["data_quality_thresholds"]
+        self._status_thresholds = np.array([thresholds["warning_pass_rate"], thresholds["critical_pass_rate"]])
         self.validation_results = {}
         self.failed_records = {}
         self.summary_stats = {}
         self.use_azure_sql = use_azure_sql
         
-        # Initialize Azure SQL connector if requested and available
+        # Initialize Azure SQL connector if requested; its database drivers are
+        # only imported here so CSV-only runs never load them
         self.azure_connector = None
-        if use_azure_sql and AZURE_SQL_AVAILABLE:
+        if use_azure_sql:
             try:
+                from src.azure_sql_connector import AzureSQLConnector
                 self.azure_connector = AzureSQLConnector()
-                print("✅ Azure SQL Database connector initialized")
+                logger.info("✅ Azure SQL Database connector initialized")
+            except ImportError:
+                logger.warning("⚠️ Azure SQL Database dependencies not available. "
+                               "Install pyodbc and related packages to use Azure SQL")
+                self.use_azure_sql = False
             except Exception as e:
-                print(f"⚠️ Azure SQL Database initialization failed: {e}")
-                print("📝 Falling back to CSV file operations")
+                logger.warning("⚠️ Azure SQL Database initialization failed: %s. "
+                               "Falling back to CSV file operations", e)
                 self.use_azure_sql = False
-        elif use_azure_sql and not AZURE_SQL_AVAILABLE:
-            print("⚠️ Azure SQL Database dependencies not available")
-            print("📝 Install pyodbc and related packages to use Azure SQL")
-            self.use_azure_sql = False
         
         # Load approved currencies
         currencies_config = load_config("config/currencies.json")
         self.approved_currencies = currencies_config.get("approved_currencies", [])
     
-    def run_all_validations(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def run_all_validations(self, df: pd.DataFrame, 
+                            duplicate_ids: Optional[pd.Index] = None,
+                            use_cache: bool = True) -> Dict[str, Any]:
         """
         Run all configured validation checks
         
         Args:
             df: Input DataFrame to validate
+            duplicate_ids: Precomputed duplicated transaction IDs, used when df is
+                one chunk of a larger dataset (see run_chunked_validations)
+            use_cache: Reuse results cached for identical input and rules, if caching is enabled
             
         Returns:
             Dictionary containing validation results
         """
-        print(f"Starting data quality validation for {len(df)} records...")
+        logger.info("Starting data quality validation for %d records...", len(df))
         
         # Initialize results
         self.validation_results = {}
-        self.failed_records = {}
-        current_df = df.copy()
+        self.failed_records = FailedRecords(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
         
-        # 1. Validate mandatory fields
-        print("✓ Checking mandatory fields...")
-        passed_df, failed_df = validate_non_null_fields(
-            current_df, 
-            self.config["validation_rules"]["mandatory_fields"]
+        cache_key = None
+        if use_cache and duplicate_ids is None and self.config.get("cache", {}).get("enabled", False):
+            cache_key = self._cache_key(df)
+            clean_data = self._load_cached_results(cache_key, df)
+            if clean_data is not None:
+                logger.info("✓ Using cached validation results (%s)", cache_key)
+                return {
+                    "validation_results": self.validation_results,
+                    "failed_records": self.failed_records,
+                    "summary_stats": self.summary_stats,
+                    "clean_data": clean_data
+                }
+        
+        # Every check is evaluated once (the independent ones in parallel when
+        # configured) and each row is coded by the first check it fails
+        codes, check_results = evaluate_checks(
+            df, self.config["validation_rules"], self.approved_currencies, duplicate_ids=duplicate_ids,
+            max_workers=self._max_workers()
         )
-        self._store_validation_result("mandatory_fields", passed_df, failed_df, len(df))
-        current_df = passed_df
-        
-        # 2. Validate amount range
-        if len(current_df) > 0:
-            print("✓ Checking amount range...")
-            amount_config = self.config["validation_rules"]["amount_validation"]
-            passed_df, failed_df = validate_amount_range(
-                current_df, 
-                amount_config["min_value"], 
-                amount_config["max_value"]
-            )
-            self._store_validation_result("amount_range", passed_df, failed_df, len(current_df))
-            current_df = passed_df
-        
-        # 3. Validate currency codes
-        if len(current_df) > 0:
-            print("✓ Checking currency codes...")
-            passed_df, failed_df = validate_currency_codes(current_df, self.approved_currencies)
-            self._store_validation_result("currency_codes", passed_df, failed_df, len(current_df))
-            current_df = passed_df
-        
-        # 4. Validate duplicate transactions
-        if len(current_df) > 0:
-            print("✓ Checking for duplicate transactions...")
-            passed_df, failed_df = validate_duplicate_transactions(current_df)
-            self._store_validation_result("duplicate_transactions", passed_df, failed_df, len(current_df))
-            current_df = passed_df
-        
-        # 5. Validate timestamp format
-        if len(current_df) > 0:
-            print("✓ Checking timestamp format...")
-            timestamp_config = self.config["validation_rules"]["timestamp_validation"]
-            passed_df, failed_df = validate_timestamp_format(
-                current_df,
-                timestamp_config["format"],
-                timestamp_config["max_future_days"]
-            )
-            self._store_validation_result("timestamp_format", passed_df, failed_df, len(current_df))
-            current_df = passed_df
-        
-        # 6. Validate account ID format (optional)
-        if len(current_df) > 0:
-            print("✓ Checking account ID format...")
-            passed_df, failed_df = validate_account_id_format(current_df)
-            self._store_validation_result("account_id_format", passed_df, failed_df, len(current_df))
-            current_df = passed_df
+        
+        # A row only counts against the first check it fails, so every check is
+        # scored on the rows still passing; checks no rows reach are skipped
+        remaining = len(df)
+        for code, check_name in enumerate(VALIDATION_CHECKS, start=1):
+            if code > 1 and remaining == 0:
+                break
+            logger.debug("✓ Checking %s...", check_name.replace("_", " "))
+            remaining = self._apply_check(check_name, df, codes == code, remaining, check_results[check_name])
+        
+        clean_data = df.loc[codes == 0]
         
         # Calculate overall summary
         self._calculate_summary_stats(len(df))
         
-        print(f"✓ Validation complete! {len(current_df)} records passed all checks.")
+        if cache_key is not None:
+            self._store_cached_results(cache_key, self._cache_expiry(df, codes))
+        
+        logger.info("✓ Validation complete! %d records passed all checks.", len(clean_data))
         
         return {
             "validation_results": self.validation_results,
             "failed_records": self.failed_records,
             "summary_stats": self.summary_stats,
-            "clean_data": current_df
+            "clean_data": clean_data
         }
     
-    def _store_validation_result(self, check_name: str, passed_df: pd.DataFrame, 
-                                failed_df: pd.DataFrame, total_records: int):
+    def run_chunked_validations(self, load_chunks: Callable[[], Iterable[pd.DataFrame]]) -> Dict[str, Any]:
+        """
+        Run all configured validation checks over data streamed in chunks
+        
+        Only per-check counters are kept in memory; failed records are spilled to
+        Feather files (when pyarrow is installed) and read back per check. Duplicate
+        transaction IDs are resolved across chunks with a first pass over the data,
+        so the results match a single run_all_validations call on the whole dataset.
+        
+        Args:
+            load_chunks: Callable returning a fresh iterable of DataFrame chunks
+            
+        Returns:
+            Dictionary containing validation results (without clean_data)
+        """
+        chunks = iter(load_chunks())
+        peeked = list(itertools.islice(chunks, 2))
+        
+        if len(peeked) < 2:
+            # Everything fit in a single chunk
+            if not peeked:
+                peeked.append(pd.DataFrame(columns=self.config["validation_rules"]["mandatory_fields"]))
+            results = self.run_all_validations(peeked[0])
+            del results["clean_data"]
+            return results
+        
+        # First pass: IDs that collide among records reaching the duplicate check.
+        # It continues the open reader, and the peeked chunks are popped as they are
+        # used, so only one chunk is held at a time.
+        candidate_parts = [self._duplicate_candidate_ids(peeked.pop(0)) for _ in range(len(peeked))]
+        candidate_parts += [self._duplicate_candidate_ids(chunk) for chunk in chunks]
+        candidate_ids = pd.concat(candidate_parts, ignore_index=True)
+        duplicate_ids = pd.Index(candidate_ids[candidate_ids.duplicated()].unique())
+        
+        # Second pass: validate chunk by chunk and accumulate results
+        total_input_records = 0
+        merged_results = {}
+        merged_failed = None
+        for chunk in load_chunks():
+            self.run_all_validations(chunk, duplicate_ids=duplicate_ids)
+            
+            for check_name, result in self.validation_results.items():
+                merged = merged_results.setdefault(
+                    check_name, {"total_records": 0, "passed_count": 0, "failed_count": 0}
+                )
+                merged["total_records"] += result["total_records"]
+                merged["passed_count"] += result["passed_count"]
+                merged["failed_count"] += result["failed_count"]
+            
+            # Each chunk's failures are spilled to disk, so neither the chunk nor
+            # its failed records stay in memory for the rest of the pass
+            if merged_failed is None:
+                merged_failed = FailedRecords(self.failed_records.run_timestamp)
+            for check_name in self.failed_records:
+                merged_failed.spill(check_name, self.failed_records.untagged(check_name))
+            
+            total_input_records += len(chunk)
+        
+        for merged in merged_results.values():
+            total_records = merged["total_records"]
+            merged["pass_rate"] = merged["passed_count"] / total_records if total_records > 0 else 0
+        
+        self.validation_results = merged_results
+        self.failed_records = merged_failed
+        self._calculate_summary_stats(total_input_records)
+        
+        return {
+            "validation_results": self.validation_results,
+            "failed_records": self.failed_records,
+            "summary_stats": self.summary_stats
+        }
+    
+    def _max_workers(self) -> int:
+        """Thread pool size for check evaluation and failed records writes (1 runs them serially)"""
+        return self.config.get("execution", {}).get("max_workers", DEFAULT_MAX_WORKERS)
+    
+    def _duplicate_candidate_ids(self, df: pd.DataFrame) -> pd.Series:
+        """Transaction IDs of records passing the checks that run before duplicate detection"""
+        candidates = duplicate_candidates(df, self.config["validation_rules"], self.approved_currencies)
+        return df.loc[candidates, 'transaction_id']
+    
+    def _cache_key(self, df: pd.DataFrame) -> str:
+        """
+        Hash the input data together with everything its validation results depend on
+        
+        The index is left out: cached failures are stored as row positions and
+        selected from the frame being validated, so they carry its own labels.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        digest.update(json.dumps([
+            _CACHE_FORMAT_VERSION,
+            pd.__version__,
+            list(map(str, df.columns)),
+            list(map(str, df.dtypes)),
+            self.config["validation_rules"],
+            list(self.approved_currencies)
+        ], sort_keys=True).encode())
+        return digest.hexdigest()
+    
+    def _cache_expiry(self, df: pd.DataFrame, codes: np.ndarray) -> Optional[pd.Timestamp]:
+        """
+        Time at which the results for df stop being valid
+        
+        The future-timestamp threshold moves with the clock, so a timestamp failed
+        as too far in the future passes once it is within max_future_days of now.
+        No other check depends on the time: results without such failures never expire.
+        
+        Args:
+            df: Input DataFrame
+            codes: First failed check of each row, as returned by evaluate_checks
+            
+        Returns:
+            Expiry time, or None if the results stay valid
+        """
+        timestamp_config = self.config["validation_rules"]["timestamp_validation"]
+        timestamps = df.loc[codes == VALIDATION_CHECKS.index("timestamp_format") + 1, 'timestamp']
+        
+        try:
+            # Null and malformed timestamps parse to NaT, leaving the future ones
+            earliest = pd.to_datetime(timestamps, format=timestamp_config["format"], errors='coerce').min()
+        except Exception:
+            # The check failed every timestamp as unparseable, which doesn't expire
+            return None
+        if pd.isna(earliest):
+            return None
+        return earliest - pd.Timedelta(days=timestamp_config["max_future_days"])
+    
+    def _load_cached_results(self, cache_key: str, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Restore the results for df from the cache
+        
+        Failed records are selected from df by their cached row positions and
+        stamped with this run's timestamp; summary statistics are recalculated.
+        Entries past their expiry time (see _cache_expiry) are misses.
+        
+        Args:
+            cache_key: Cache key of df
+            df: Input DataFrame being validated
+            
+        Returns:
+            Clean data, or None if there is no usable cache entry
+        """
+        cache_path = os.path.join(self.config["cache"]["directory"], f"{cache_key}.pkl")
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                validation_results, failures, expires_at = pickle.load(f)
+            if expires_at is not None and pd.Timestamp.now() >= expires_at:
+                raise ValueError(f"expired at {expires_at}")
+            
+            passed = np.ones(len(df), dtype=bool)
+            for check_name, (positions, failure_reason, failed_fields) in failures.items():
+                passed[positions] = False
+                self.failed_records.add_positions(check_name, df, positions, failure_reason, failed_fields)
+            self.validation_results = validation_results
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Entries that can't be read back (corrupt, other layout or pandas
+            # version) or have expired are misses; drop them so they are rewritten
+            logger.debug("Discarding cache entry %s: %s", cache_path, e)
+            self.failed_records = FailedRecords(self.failed_records.run_timestamp)
+            with contextlib.suppress(OSError):
+                os.remove(cache_path)
+            return None
+        
+        # Mark as recently used for LRU eviction
+        os.utime(cache_path)
+        self._calculate_summary_stats(len(df))
+        return df.loc[passed]
+    
+    def _store_cached_results(self, cache_key: str, expires_at: Optional[pd.Timestamp]):
+        """
+        Cache the current results, evicting the least recently used entries
+        
+        Entries hold the per-check results, for each check the row positions of
+        its failures with their failure_reason and failed_fields values, and the
+        time the results expire (None if they don't).
+        """
+        cache_config = self.config["cache"]
+        cache_dir = cache_config["directory"]
+        create_directory_if_not_exists(cache_dir)
+        
+        cache_path = os.path.join(cache_dir, f"{cache_key}.pkl")
+        temp_path = f"{cache_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump((self.validation_results, self.failed_records.to_positions(), expires_at), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+        
+        entries = sorted(
+            (os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith(".pkl")),
+            key=os.path.getmtime
+        )
+        for stale_path in entries[:-cache_config.get("max_entries", 16)]:
+            os.remove(stale_path)
+    
+    def _apply_check(self, check_name: str, df: pd.DataFrame, failed_mask: np.ndarray,
+                     total_records: int, check_result: Tuple[pd.Series, Any, Any]) -> int:
+        """
+        Store a check's result for the records it was the first to fail
+        
+        Args:
+            check_name: Name of the validation check
+            df: Full input DataFrame
+            failed_mask: Boolean array of the records whose first failed check is this one
+            total_records: Number of records reaching this check
+            check_result: Tuple of (failure_mask, failure_reason, failed_fields) from a validator
+            
+        Returns:
+            Number of records still passing after this check
+        """
+        _, failure_reason, failed_fields = check_result
+        
+        # Only the row positions and their annotations are kept; the records
+        # themselves are selected when they are read
+        positions = np.flatnonzero(failed_mask)
+        if len(positions) > 0:
+            self.failed_records.add_positions(check_name, df, positions,
+                                              take_failure_values(failure_reason, positions),
+                                              take_failure_values(failed_fields, positions))
+        
+        passed_count = total_records - len(positions)
+        self._store_validation_result(check_name, passed_count, len(positions), total_records)
+        return passed_count
+    
+    def _store_validation_result(self, check_name: str, passed_count: int, 
+                                failed_count: int, total_records: int):
         """Store validation result for a specific check"""
         self.validation_results[check_name] = {
             "total_records": total_records,
-            "passed_count": len(passed_df),
-            "failed_count": len(failed_df),
-            "pass_rate": len(passed_df) / total_records if total_records > 0 else 0
+            "passed_count": passed_count,
+            "failed_count": failed_count,
+            "pass_rate": passed_count / total_records if total_records > 0 else 0
         }
-        
-        if len(failed_df) > 0:
-            # Add validation check name and timestamp
-            failed_df['validation_check'] = check_name
-            failed_df['validation_timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.failed_records[check_name] = failed_df
     
     def _calculate_summary_stats(self, total_input_records: int):
         """Calculate overall summary statistics"""
-        total_failed = sum([result["failed_count"] for result in self.validation_results.values()])
+        total_failed = int(np.fromiter((result["failed_count"] for result in self.validation_results.values()),
+                                       dtype=np.int64, count=len(self.validation_results)).sum())
         total_passed = total_input_records - total_failed
         
         self.summary_stats = {
@@ -180,37 +500,69 @@ class DataQualityFramework:
         
         # Determine data quality status
         pass_rate = self.summary_stats["overall_pass_rate"]
-        critical_threshold = self.config["data_quality_thresholds"]["critical_pass_rate"]
-        warning_threshold = self.config["data_quality_thresholds"]["warning_pass_rate"]
-        
-        if pass_rate >= critical_threshold:
-            self.summary_stats["quality_status"] = "EXCELLENT"
-        elif pass_rate >= warning_threshold:
-            self.summary_stats["quality_status"] = "WARNING"
-        else:
-            self.summary_stats["quality_status"] = "CRITICAL"
+        status_index = int(np.searchsorted(self._status_thresholds, pass_rate, side='right'))
+        self.summary_stats["quality_status"] = ("CRITICAL", "WARNING", "EXCELLENT")[status_index]
     
-    def save_failed_records(self, output_dir: str = "data/failed_records"):
-        """Save failed records to files and/or Azure SQL Database"""
-        # Save to CSV files (always)
+    def save_failed_records(self, output_dir: str = "data/failed_records", file_format: str = "parquet"):
+        """
+        Save failed records to files and/or Azure SQL Database
+        
+        With execution.max_workers above 1, every check's file write (and Azure SQL
+        insert, if enabled) runs on a thread pool so that local disk and network
+        writes overlap.
+        
+        Args:
+            output_dir: Directory for the failed records files
+            file_format: 'parquet', 'feather' or 'csv'; the binary formats fall back
+                to CSV when pyarrow is not installed
+        """
+        file_format = resolve_failed_records_format(file_format)
+        
+        # Save to files (always)
         create_directory_if_not_exists(output_dir)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        for check_name, failed_df in self.failed_records.items():
-            # Save to CSV
-            filename = f"failed_{check_name}_{timestamp}.csv"
-            filepath = os.path.join(output_dir, filename)
-            failed_df.to_csv(filepath, index=False)
-            print(f"✓ Saved {len(failed_df)} failed records to {filepath}")
+        # Each task materializes its check's records itself, so only the checks
+        # being written are held in memory at once
+        tasks = []
+        for check_name in self.failed_records:
+            filepath = os.path.join(output_dir, f"failed_{check_name}_{timestamp}.{file_format}")
+            tasks.append(partial(self._write_failed_records_file, check_name, filepath, file_format))
             
             # Save to Azure SQL Database if enabled
             if self.use_azure_sql and self.azure_connector:
-                try:
-                    success = self.azure_connector.save_failed_records(failed_df, check_name)
-                    if success:
-                        print(f"✓ Saved {len(failed_df)} failed records to Azure SQL Database")
-                except Exception as e:
-                    print(f"⚠️ Failed to save to Azure SQL Database: {e}")
+                tasks.append(partial(self._save_failed_records_to_azure, check_name))
+        
+        if not tasks:
+            return
+        
+        # Tasks return their (log level, status message), logged here in submission order
+        max_workers = self._max_workers()
+        if max_workers <= 1:
+            statuses = [task() for task in tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+                futures = [executor.submit(task) for task in tasks]
+            statuses = [future.result() for future in futures]
+        for status in statuses:
+            logger.log(*status)
+    
+    def _write_failed_records_file(self, check_name: str, filepath: str,
+                                   file_format: str) -> Tuple[int, str]:
+        """Write one check's failed records to a file"""
+        failed_df = self.failed_records[check_name]
+        write_failed_records_file(failed_df, filepath, file_format)
+        return logging.INFO, f"✓ Saved {len(failed_df)} failed records to {filepath}"
+    
+    def _save_failed_records_to_azure(self, check_name: str) -> Tuple[int, str]:
+        """Insert one check's failed records into Azure SQL Database"""
+        try:
+            failed_df = self.failed_records[check_name]
+            if self.azure_connector.save_failed_records(failed_df, check_name):
+                return logging.INFO, f"✓ Saved {len(failed_df)} failed records to Azure SQL Database"
+            return logging.WARNING, f"⚠️ Failed to save {check_name} records to Azure SQL Database"
+        except Exception as e:
+            return logging.WARNING, f"⚠️ Failed to save to Azure SQL Database: {e}"
     
     def save_quality_report(self):
         """Save quality report summary to Azure SQL Database"""
@@ -218,9 +570,9 @@ class DataQualityFramework:
             try:
                 success = self.azure_connector.save_quality_report(self.summary_stats)
                 if success:
-                    print("✓ Quality report saved to Azure SQL Database")
+                    logger.info("✓ Quality report saved to Azure SQL Database")
             except Exception as e:
-                print(f"⚠️ Failed to save quality report to Azure SQL: {e}")
+                logger.warning("⚠️ Failed to save quality report to Azure SQL: %s", e)
     
     def load_data_from_azure(self, query: Optional[str] = None, limit: Optional[int] = None) -> Optional[pd.DataFrame]:
         """
@@ -234,32 +586,30 @@ class DataQualityFramework:
             pd.DataFrame or None: Transaction data or None if failed
         """
         if not self.use_azure_sql or not self.azure_connector:
-            print("⚠️ Azure SQL Database not configured")
+            logger.warning("⚠️ Azure SQL Database not configured")
             return None
         
         try:
-            df = self.azure_connector.load_transactions(query=query, limit=limit)
-            print(f"✅ Loaded {len(df)} transactions from Azure SQL Database")
+            df = optimize_transaction_dtypes(self.azure_connector.load_transactions(query=query, limit=limit))
+            logger.info("✅ Loaded %d transactions from Azure SQL Database", len(df))
             return df
         except Exception as e:
-            print(f"❌ Failed to load data from Azure SQL Database: {e}")
+            logger.error("❌ Failed to load data from Azure SQL Database: %s", e)
             return None
     
     def get_validation_summary(self) -> pd.DataFrame:
         """Get a summary DataFrame of all validation results"""
-        summary_data = []
-        
-        for check_name, result in self.validation_results.items():
-            summary_data.append({
-                "Validation_Check": check_name,
-                "Total_Records": result["total_records"],
-                "Passed_Count": result["passed_count"],
-                "Failed_Count": result["failed_count"],
-                "Pass_Rate": f"{result['pass_rate']:.2%}",
-                "Status": "✓ PASS" if result["pass_rate"] >= 0.95 else "⚠ WARNING" if result["pass_rate"] >= 0.90 else "✗ FAIL"
-            })
-        
-        return pd.DataFrame(summary_data)
+        results = list(self.validation_results.values())
+        pass_rates = np.array([result["pass_rate"] for result in results], dtype=np.float64)
+        
+        return pd.DataFrame({
+            "Validation_Check": list(self.validation_results.keys()),
+            "Total_Records": np.array([result["total_records"] for result in results], dtype=np.int64),
+            "Passed_Count": np.array([result["passed_count"] for result in results], dtype=np.int64),
+            "Failed_Count": np.array([result["failed_count"] for result in results], dtype=np.int64),
+            "Pass_Rate": [f"{rate:.2%}" for rate in pass_rates],
+            "Status": np.select([pass_rates >= 0.95, pass_rates >= 0.90], ["✓ PASS", "⚠ WARNING"], default="✗ FAIL")
+        })
     
     def print_summary(self):
         """Print a formatted summary of validation results"""
@@ -4,16 +4,26 @@ Generates various reports including weekly summaries and detailed analysis
 """
 
 import pandas as pd
+import logging
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 import os
 from typing import Dict, List, Any
-from src.utils import create_directory_if_not_exists, export_to_excel
+from src.utils import create_directory_if_not_exists, export_to_excel, PYARROW_AVAILABLE
+
+
+logger = logging.getLogger(__name__)
+
+# Pass rate buckets (CRITICAL below 90%, WARNING below 95%, EXCELLENT otherwise)
+# and the labels for each bucket, in bucket order
+_STATUS_BUCKETS = np.array([0.90, 0.95])
+_STATUS_LABELS = np.array(["❌ CRITICAL", "⚠️ WARNING", "✅ EXCELLENT"])
+_STATUS_CLASSES = np.array(["critical", "warning", "excellent"])
+_RECOMMENDATIONS = np.array([
+    "Immediate investigation required. Review data sources and validation rules.",
+    "Monitor closely and investigate root causes of failures.",
+    "Maintain current data quality standards."
+])
 
 
 class DataQualityReportGenerator:
@@ -21,68 +31,92 @@ class DataQualityReportGenerator:
     Generate comprehensive data quality reports
     """
     
-    def __init__(self, output_dir: str = "data/reports"):
+    def __init__(self, output_dir: str = "data/reports", chart_dpi: int = 150):
         """
         Initialize report generator
         
         Args:
             output_dir: Directory to save reports
+            chart_dpi: Resolution of the saved chart images
         """
         self.output_dir = output_dir
+        self.chart_dpi = chart_dpi
         create_directory_if_not_exists(output_dir)
-        
-        # Set up plotting style
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
     
     def generate_weekly_report(self, validation_results: Dict[str, Any], 
-                             week_start: datetime = None) -> str:
+                             week_start: datetime = None,
+                             report_format: str = "parquet") -> str:
         """
         Generate comprehensive weekly data quality report
         
         Args:
             validation_results: Results from data quality framework
             week_start: Start date of the week (defaults to current week)
+            report_format: 'parquet' writes one Parquet file per report sheet, indexed by
+                the HTML summary; 'xlsx' writes a single Excel workbook. Parquet falls back
+                to Excel when pyarrow is not installed.
             
         Returns:
-            Path to generated report file
+            Path to generated report file (the HTML summary for Parquet reports)
         """
+        if report_format not in ("parquet", "xlsx"):
+            raise ValueError(f"Unsupported report format: {report_format}")
+        if report_format == "parquet" and not PYARROW_AVAILABLE:
+            logger.warning("⚠️ pyarrow not installed, writing the weekly report as Excel")
+            report_format = "xlsx"
+        
+        # Read the clock once so the report contents and every file name share one timestamp
+        now = pd.Timestamp.now()
         if week_start is None:
-            week_start = datetime.now() - timedelta(days=datetime.now().weekday())
+            week_start = (now - pd.Timedelta(days=now.weekday())).normalize().to_pydatetime()
         
         week_end = week_start + timedelta(days=6)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        report_name = f"Weekly_DQ_Report_{week_start.strftime('%Y%m%d')}_{timestamp}"
         
         # Create report data structure
         report_data = {
-            "Summary": self._create_summary_sheet(validation_results),
+            "Summary": self._create_summary_sheet(validation_results, now),
             "Validation_Details": self._create_validation_details_sheet(validation_results),
             "Failed_Records_Summary": self._create_failed_records_summary(validation_results),
             "Trends": self._create_trends_sheet(validation_results)
         }
         
-        # Generate Excel report
-        report_filename = f"Weekly_DQ_Report_{week_start.strftime('%Y%m%d')}_{timestamp}.xlsx"
-        report_path = os.path.join(self.output_dir, report_filename)
-        export_to_excel(report_data, report_path)
+        if report_format == "xlsx":
+            # Generate Excel report
+            report_path = os.path.join(self.output_dir, f"{report_name}.xlsx")
+            export_to_excel(report_data, report_path)
+            data_files = [report_path]
+        else:
+            # Generate one Parquet file per sheet
+            data_files = []
+            for sheet_name, sheet_df in report_data.items():
+                sheet_path = os.path.join(self.output_dir, f"{report_name}_{sheet_name}.parquet")
+                sheet_df.to_parquet(sheet_path, compression="zstd", index=False)
+                data_files.append(sheet_path)
         
         # Generate visualizations
-        self._generate_report_visualizations(validation_results, week_start)
+        self._generate_report_visualizations(validation_results, week_start, timestamp)
         
         # Generate HTML summary
-        html_report_path = self._generate_html_report(validation_results, week_start, week_end)
+        html_report_path = self._generate_html_report(validation_results, week_start, week_end,
+                                                      data_files, report_name, now)
         
-        print(f"✓ Weekly report generated: {report_path}")
-        print(f"✓ HTML summary generated: {html_report_path}")
+        if report_format == "xlsx":
+            logger.info("✓ Weekly report generated: %s", report_path)
+        else:
+            report_path = html_report_path
+            logger.info("✓ Weekly report data generated: %d Parquet files in %s", len(data_files), self.output_dir)
+        logger.info("✓ HTML summary generated: %s", html_report_path)
         
         return report_path
     
-    def _create_summary_sheet(self, validation_results: Dict[str, Any]) -> pd.DataFrame:
+    def _create_summary_sheet(self, validation_results: Dict[str, Any], generated_at: datetime) -> pd.DataFrame:
         """Create executive summary sheet"""
         summary_stats = validation_results.get("summary_stats", {})
         
         summary_data = [
-            ["Report Generation Date", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+            ["Report Generation Date", generated_at.strftime("%Y-%m-%d %H:%M:%S")],
             ["Validation Timestamp", summary_stats.get("validation_timestamp", "N/A")],
             ["Total Input Records", f"{summary_stats.get('total_input_records', 0):,}"],
             ["Total Passed Records", f"{summary_stats.get('total_passed_records', 0):,}"],
@@ -97,19 +131,17 @@ class DataQualityReportGenerator:
     def _create_validation_details_sheet(self, validation_results: Dict[str, Any]) -> pd.DataFrame:
         """Create detailed validation results sheet"""
         validation_data = validation_results.get("validation_results", {})
-        
-        details = []
-        for check_name, result in validation_data.items():
-            details.append({
-                "Validation_Check": check_name.replace("_", " ").title(),
-                "Total_Records": result.get("total_records", 0),
-                "Passed_Records": result.get("passed_count", 0),
-                "Failed_Records": result.get("failed_count", 0),
-                "Pass_Rate": f"{result.get('pass_rate', 0):.2%}",
-                "Status": self._get_status_indicator(result.get('pass_rate', 0))
-            })
-        
-        return pd.DataFrame(details)
+        results = list(validation_data.values())
+        pass_rates = self._pass_rates(validation_data)
+        
+        return pd.DataFrame({
+            "Validation_Check": [check_name.replace("_", " ").title() for check_name in validation_data],
+            "Total_Records": [result.get("total_records", 0) for result in results],
+            "Passed_Records": [result.get("passed_count", 0) for result in results],
+            "Failed_Records": [result.get("failed_count", 0) for result in results],
+            "Pass_Rate": [f"{rate:.2%}" for rate in pass_rates],
+            "Status": _STATUS_LABELS[self._status_buckets(pass_rates)]
+        })
     
     def _create_failed_records_summary(self, validation_results: Dict[str, Any]) -> pd.DataFrame:
         """Create summary of failed records by validation check"""
@@ -118,67 +150,85 @@ class DataQualityReportGenerator:
         if not failed_records:
             return pd.DataFrame({"Message": ["No failed records found"]})
         
-        summary_data = []
+        columns = ["Validation_Check", "Failure_Reason", "Failed_Count", "Sample_Failed_Fields"]
+        summaries = []
         for check_name, failed_df in failed_records.items():
             if len(failed_df) > 0:
-                # Get most common failure reasons
-                failure_reasons = failed_df['failure_reason'].value_counts()
+                # Count each failure reason and take a sample of its failed fields in one
+                # grouping, keyed on category codes rather than hashed reason strings
+                failed_df = failed_df.astype({'failure_reason': 'category'})
+                grouped = failed_df.groupby('failure_reason', sort=False, observed=True)
+                summary = grouped.size().rename("Failed_Count").to_frame()
+                summary["Sample_Failed_Fields"] = grouped['failed_fields'].first() if 'failed_fields' in failed_df.columns else "N/A"
                 
-                for reason, count in failure_reasons.items():
-                    summary_data.append({
-                        "Validation_Check": check_name.replace("_", " ").title(),
-                        "Failure_Reason": reason,
-                        "Failed_Count": count,
-                        "Sample_Failed_Fields": failed_df[failed_df['failure_reason'] == reason]['failed_fields'].iloc[0] if 'failed_fields' in failed_df.columns else "N/A"
-                    })
-        
-        return pd.DataFrame(summary_data)
+                # Most common failure reasons first
+                summary = summary.sort_values("Failed_Count", ascending=False, kind="stable")
+                summaries.append(summary.reset_index(names="Failure_Reason").assign(
+                    Validation_Check=check_name.replace("_", " ").title()
+                ))
+        
+        if not summaries:
+            return pd.DataFrame(columns=columns)
+        
+        return pd.concat(summaries, ignore_index=True)[columns]
     
     def _create_trends_sheet(self, validation_results: Dict[str, Any]) -> pd.DataFrame:
         """Create trends analysis sheet (placeholder for historical data)"""
         # This would typically involve historical data comparison
         # For now, we'll create a placeholder
         validation_data = validation_results.get("validation_results", {})
-        
-        trends_data = []
-        for check_name, result in validation_data.items():
-            trends_data.append({
-                "Validation_Check": check_name.replace("_", " ").title(),
-                "Current_Pass_Rate": f"{result.get('pass_rate', 0):.2%}",
-                "Previous_Week": "N/A (Historical data not available)",
-                "Trend": "→ Stable",
-                "Recommendation": self._get_recommendation(result.get('pass_rate', 0))
-            })
-        
-        return pd.DataFrame(trends_data)
+        pass_rates = self._pass_rates(validation_data)
+        
+        return pd.DataFrame({
+            "Validation_Check": [check_name.replace("_", " ").title() for check_name in validation_data],
+            "Current_Pass_Rate": [f"{rate:.2%}" for rate in pass_rates],
+            "Previous_Week": "N/A (Historical data not available)",
+            "Trend": "→ Stable",
+            "Recommendation": _RECOMMENDATIONS[self._status_buckets(pass_rates)]
+        })
     
-    def _generate_report_visualizations(self, validation_results: Dict[str, Any], week_start: datetime):
+    def _generate_report_visualizations(self, validation_results: Dict[str, Any], week_start: datetime,
+                                        timestamp: str):
         """Generate visualization charts for the report"""
         validation_data = validation_results.get("validation_results", {})
         
         if not validation_data:
             return
         
+        # Plotting libraries are slow to import, so only load them when charts are drawn.
+        # The figure is built without pyplot: it renders straight to an Agg canvas, needs
+        # no GUI backend and is never registered as an open pyplot figure.
+        import matplotlib.style
+        import seaborn as sns
+        from matplotlib.figure import Figure
+        
+        # Set up plotting style
+        matplotlib.style.use('seaborn-v0_8')
+        sns.set_palette("husl")
+        
         # Create pass/fail rate chart
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        fig = Figure(figsize=(15, 12))
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
         
-        # 1. Pass rates by validation check
+        # Per-check values shared by the charts
         checks = [check.replace("_", " ").title() for check in validation_data.keys()]
-        pass_rates = [result.get('pass_rate', 0) * 100 for result in validation_data.values()]
+        results = list(validation_data.values())
+        pass_rates = np.fromiter((result.get('pass_rate', 0) for result in results),
+                                 dtype=np.float64, count=len(results)) * 100
+        failed_counts = np.fromiter((result.get('failed_count', 0) for result in results),
+                                    dtype=np.int64, count=len(results))
         
-        bars = ax1.bar(checks, pass_rates, color=['green' if rate >= 95 else 'orange' if rate >= 90 else 'red' for rate in pass_rates])
+        # 1. Pass rates by validation check
+        bars = ax1.bar(checks, pass_rates, color=self._rate_colors(pass_rates))
         ax1.set_title('Pass Rates by Validation Check')
         ax1.set_ylabel('Pass Rate (%)')
         ax1.tick_params(axis='x', rotation=45)
         ax1.set_ylim(0, 100)
         
         # Add value labels on bars
-        for bar, rate in zip(bars, pass_rates):
-            ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, 
-                    f'{rate:.1f}%', ha='center', va='bottom')
+        ax1.bar_label(bars, fmt='%.1f%%')
         
         # 2. Failed records count
-        failed_counts = [result.get('failed_count', 0) for result in validation_data.values()]
         ax2.bar(checks, failed_counts, color='red', alpha=0.7)
         ax2.set_title('Failed Records by Validation Check')
         ax2.set_ylabel('Number of Failed Records')
@@ -196,28 +246,33 @@ class DataQualityReportGenerator:
         
         # 4. Quality score gauge (simplified as bar)
         overall_pass_rate = summary_stats.get('overall_pass_rate', 0) * 100
-        ax4.barh(['Quality Score'], [overall_pass_rate], color='green' if overall_pass_rate >= 95 else 'orange' if overall_pass_rate >= 90 else 'red')
+        ax4.barh(['Quality Score'], [overall_pass_rate], color=self._rate_colors(np.array([overall_pass_rate])))
         ax4.set_xlim(0, 100)
         ax4.set_xlabel('Quality Score (%)')
         ax4.set_title(f'Overall Quality Score: {overall_pass_rate:.1f}%')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save the plot
-        chart_filename = f"DQ_Charts_{week_start.strftime('%Y%m%d')}.png"
+        chart_filename = f"DQ_Charts_{week_start.strftime('%Y%m%d')}_{timestamp}.png"
         chart_path = os.path.join(self.output_dir, chart_filename)
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(chart_path, dpi=self.chart_dpi, bbox_inches='tight')
         
-        print(f"✓ Charts saved: {chart_path}")
+        logger.info("✓ Charts saved: %s", chart_path)
+    
+    def _rate_colors(self, pass_rates: np.ndarray) -> List[str]:
+        """Map pass rates (in percent) to chart colors"""
+        return np.select([pass_rates >= 95, pass_rates >= 90], ['green', 'orange'], default='red').tolist()
     
     def _generate_html_report(self, validation_results: Dict[str, Any], 
-                            week_start: datetime, week_end: datetime) -> str:
+                            week_start: datetime, week_end: datetime,
+                            data_files: List[str], report_name: str,
+                            generated_at: datetime) -> str:
         """Generate HTML summary report"""
         summary_stats = validation_results.get("summary_stats", {})
         validation_data = validation_results.get("validation_results", {})
         
-        html_content = f"""
+        parts = [f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -239,7 +294,7 @@ class DataQualityReportGenerator:
             <div class="header">
                 <h1>📊 Weekly Data Quality Report</h1>
                 <p><strong>Report Period:</strong> {week_start.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')}</p>
-                <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+                <p><strong>Generated:</strong> {generated_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
             </div>
             
             <div class="summary">
@@ -261,46 +316,60 @@ class DataQualityReportGenerator:
                     <th>Pass Rate</th>
                     <th>Status</th>
                 </tr>
-        """
+        """]
         
-        for check_name, result in validation_data.items():
-            status_class = "excellent" if result.get('pass_rate', 0) >= 0.95 else "warning" if result.get('pass_rate', 0) >= 0.90 else "critical"
-            html_content += f"""
+        buckets = self._status_buckets(self._pass_rates(validation_data))
+        for (check_name, result), bucket in zip(validation_data.items(), buckets):
+            parts.append(f"""
                 <tr>
                     <td>{check_name.replace('_', ' ').title()}</td>
                     <td>{result.get('total_records', 0):,}</td>
                     <td>{result.get('passed_count', 0):,}</td>
                     <td>{result.get('failed_count', 0):,}</td>
                     <td>{result.get('pass_rate', 0):.2%}</td>
-                    <td class="status-{status_class}">{self._get_status_indicator(result.get('pass_rate', 0))}</td>
+                    <td class="status-{_STATUS_CLASSES[bucket]}">{_STATUS_LABELS[bucket]}</td>
                 </tr>
-            """
+            """)
         
-        html_content += """
+        parts.append("""
             </table>
             
             <h2>💡 Recommendations</h2>
             <ul>
-        """
+        """)
         
         # Add recommendations based on results
-        for check_name, result in validation_data.items():
-            if result.get('pass_rate', 0) < 0.90:
-                html_content += f"<li><strong>{check_name.replace('_', ' ').title()}:</strong> {self._get_recommendation(result.get('pass_rate', 0))}</li>"
+        for check_name, bucket in zip(validation_data, buckets):
+            if bucket == 0:
+                parts.append(f"<li><strong>{check_name.replace('_', ' ').title()}:</strong> {_RECOMMENDATIONS[bucket]}</li>")
+        
+        parts.append("""
+            </ul>
+            
+            <h2>📁 Report Data</h2>
+            <ul>
+        """)
+        
+        # Link the report data files, which are saved next to this page
+        for data_file in data_files:
+            file_name = os.path.basename(data_file)
+            parts.append(f'<li><a href="{file_name}">{file_name}</a></li>')
         
-        html_content += """
+        parts.append("""
             </ul>
             
             <div class="footer" style="margin-top: 40px; padding: 20px; background-color: #f9f9f9; border-radius: 5px;">
                 <p><em>This report was automatically generated by the Data Quality Framework.</em></p>
-                <p><em>For detailed failed records analysis, please refer to the Excel report and failed records CSV files.</em></p>
+                <p><em>For detailed failed records analysis, please refer to the report data files and failed records files.</em></p>
             </div>
         </body>
         </html>
-        """
+        """)
+        
+        html_content = "".join(parts)
         
         # Save HTML report
-        html_filename = f"Weekly_DQ_Report_{week_start.strftime('%Y%m%d')}.html"
+        html_filename = f"{report_name}.html"
         html_path = os.path.join(self.output_dir, html_filename)
         
         with open(html_path, 'w', encoding='utf-8') as f:
@@ -308,20 +377,19 @@ class DataQualityReportGenerator:
         
         return html_path
     
+    def _pass_rates(self, validation_data: Dict[str, Any]) -> np.ndarray:
+        """Collect the pass rate of every check into an array"""
+        return np.fromiter((result.get('pass_rate', 0) for result in validation_data.values()),
+                           dtype=np.float64, count=len(validation_data))
+    
+    def _status_buckets(self, pass_rates: np.ndarray) -> np.ndarray:
+        """Map pass rates to indices into the status label/recommendation arrays"""
+        return np.searchsorted(_STATUS_BUCKETS, pass_rates, side='right')
+    
     def _get_status_indicator(self, pass_rate: float) -> str:
         """Get status indicator based on pass rate"""
-        if pass_rate >= 0.95:
-            return "✅ EXCELLENT"
-        elif pass_rate >= 0.90:
-            return "⚠️ WARNING"
-        else:
-            return "❌ CRITICAL"
+        return str(_STATUS_LABELS[self._status_buckets(pass_rate)])
     
     def _get_recommendation(self, pass_rate: float) -> str:
         """Get recommendation based on pass rate"""
-        if pass_rate >= 0.95:
-            return "Maintain current data quality standards."
-        elif pass_rate >= 0.90:
-            return "Monitor closely and investigate root causes of failures."
-        else:
-            return "Immediate investigation required. Review data sources and validation rules."
+        return str(_RECOMMENDATIONS[self._status_buckets(pass_rate)])
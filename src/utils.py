@@ -2,17 +2,71 @@
 Utility functions for the data quality framework
 """
 
+import copy
 import json
+import logging
 import os
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Mapping, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# pyarrow backs string columns and the CSV parser when installed (optional)
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+_STRING_DTYPE = 'string[pyarrow]' if PYARROW_AVAILABLE else 'string'
+
+# orjson parses configuration files in C when installed (optional)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Column dtypes for the transaction schema, shared by every loader. Currency has
+# few distinct values so it is stored as category codes. Timestamps stay as
+# strings so malformed values reach the timestamp check.
+TRANSACTION_DTYPES = {
+    'transaction_id': _STRING_DTYPE,
+    'account_id': _STRING_DTYPE,
+    'amount': 'float64',
+    'currency': 'category',
+    'timestamp': _STRING_DTYPE
+}
+
+# Rows per chunk when streaming large CSV files (roughly 100-250 MB in memory)
+DEFAULT_CHUNKSIZE = 500_000
+
+# Write buffer for CSV output files
+CSV_BUFFER_SIZE = 1024 * 1024
+
+# Thread pool size for check evaluation and failed records writes, unless
+# execution.max_workers is configured
+DEFAULT_MAX_WORKERS = 4
+
+# Display symbols for currency codes; other codes are shown as-is
+CURRENCY_SYMBOLS = {
+    'USD': '$', 'EUR': '€', 'GBP': '£', 'JPY': '¥',
+    'CAD': 'C$', 'AUD': 'A$', 'CHF': 'CHF'
+}
 
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from JSON file
     
+    Parsed files are cached by path and modification time, so repeated loads
+    skip the disk read until the file changes. Each call returns its own copy.
+    
     Args:
         config_path: Path to configuration file
         
@@ -20,14 +74,87 @@ def load_config(config_path: str) -> Dict[str, Any]:
         Configuration dictionary
     """
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        mtime = os.path.getmtime(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    
+    return copy.deepcopy(_load_config_cached(config_path, mtime))
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a configuration file; mtime is part of the cache key only"""
+    try:
+        with open(config_path, 'rb') as f:
+            return _json_loads(f.read())
     except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in configuration file {config_path}: {e}")
 
 
+def load_transactions_csv(file_path: str) -> pd.DataFrame:
+    """
+    Load transaction data from a CSV file using the transaction schema dtypes
+    
+    Args:
+        file_path: Path to the CSV file
+        
+    Returns:
+        DataFrame with transaction data
+    """
+    if not PYARROW_AVAILABLE:
+        return pd.read_csv(file_path, dtype=TRANSACTION_DTYPES)
+    
+    from pyarrow import csv as pa_csv
+    
+    # String columns are typed at parse time: pandas' pyarrow engine would first
+    # infer timestamps and rewrite them (dropping midnight times or a 'T'
+    # separator) before the timestamp check sees them
+    string_columns = [col for col, dtype in TRANSACTION_DTYPES.items() if dtype != 'float64']
+    convert_options = pa_csv.ConvertOptions(
+        column_types={col: pyarrow.string() for col in string_columns},
+        strings_can_be_null=True
+    )
+    table = pa_csv.read_csv(file_path, convert_options=convert_options)
+    
+    df = table.to_pandas()
+    return df.astype({col: dtype for col, dtype in TRANSACTION_DTYPES.items() if col in df.columns})
+
+
+def optimize_transaction_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert ID and currency columns of loaded transaction data to compact dtypes
+    
+    Args:
+        df: Transaction DataFrame, e.g. loaded from a database
+        
+    Returns:
+        DataFrame with transaction_id, account_id and currency converted
+    """
+    columns = ['transaction_id', 'account_id', 'currency']
+    return df.astype({col: TRANSACTION_DTYPES[col] for col in columns if col in df.columns})
+
+
+def iter_transactions_csv(file_path: str, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """
+    Stream transaction data from a CSV file in chunks
+    
+    pyarrow's CSV reader is not used for chunked reads, so this uses the C engine
+    with the same transaction schema dtypes as load_transactions_csv.
+    
+    Args:
+        file_path: Path to the CSV file
+        chunksize: Number of rows per chunk
+        
+    Yields:
+        DataFrame chunks with transaction data
+    """
+    with pd.read_csv(file_path, dtype=TRANSACTION_DTYPES, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield chunk
+
+
 def create_directory_if_not_exists(directory_path: str):
     """
     Create directory if it doesn't exist
@@ -35,63 +162,129 @@ def create_directory_if_not_exists(directory_path: str):
     Args:
         directory_path: Path to directory to create
     """
-    if not os.path.exists(directory_path):
-        os.makedirs(directory_path)
-        print(f"✓ Created directory: {directory_path}")
+    os.makedirs(directory_path, exist_ok=True)
 
 
-def save_failed_records(failed_records_dict: Dict[str, pd.DataFrame], 
-                       output_dir: str = "data/failed_records"):
+def resolve_failed_records_format(file_format: str) -> str:
     """
-    Save failed records to CSV files
+    Validate a failed records file format
     
     Args:
-        failed_records_dict: Dictionary of failed records by validation check
+        file_format: 'parquet', 'feather' or 'csv'
+        
+    Returns:
+        The format to write; the binary formats fall back to CSV when pyarrow is not installed
+    """
+    if file_format not in ("parquet", "feather", "csv"):
+        raise ValueError(f"Unsupported failed records format: {file_format}")
+    if file_format != "csv" and not PYARROW_AVAILABLE:
+        logger.warning("⚠️ pyarrow not installed, saving failed records as CSV")
+        return "csv"
+    return file_format
+
+
+def write_failed_records_file(failed_df: pd.DataFrame, filepath: str, file_format: str = "parquet",
+                              buffering: int = CSV_BUFFER_SIZE):
+    """
+    Write one check's failed records to a file
+    
+    Args:
+        failed_df: Failed records DataFrame
+        filepath: Output file path
+        file_format: 'parquet' (zstd compressed), 'feather' or 'csv'
+        buffering: Write buffer size in bytes for CSV files
+    """
+    if file_format == "parquet":
+        failed_df.to_parquet(filepath, compression="zstd", index=False)
+    elif file_format == "feather":
+        failed_df.reset_index(drop=True).to_feather(filepath)
+    else:
+        with open(filepath, 'wb', buffering=buffering) as f:
+            failed_df.to_csv(f, index=False)
+
+
+def save_failed_records(failed_records_dict: Mapping[str, pd.DataFrame], 
+                       output_dir: str = "data/failed_records",
+                       file_format: str = "parquet",
+                       max_workers: int = DEFAULT_MAX_WORKERS):
+    """
+    Save failed records to one file per validation check
+    
+    With max_workers above 1 the files are written on a thread pool, so writes
+    for different checks overlap.
+    Each check's records are looked up by the worker writing them, so lazy mappings
+    such as DataQualityFramework.failed_records only build the checks in flight.
+    
+    Args:
+        failed_records_dict: Mapping of failed records by validation check
         output_dir: Output directory for failed records
+        file_format: 'parquet', 'feather' or 'csv'; the binary formats fall back
+            to CSV when pyarrow is not installed
+        max_workers: Maximum number of files written at once
     """
+    file_format = resolve_failed_records_format(file_format)
     create_directory_if_not_exists(output_dir)
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    check_names = list(failed_records_dict)
+    
+    if not check_names:
+        return
     
-    for check_name, failed_df in failed_records_dict.items():
-        if len(failed_df) > 0:
-            filename = f"failed_{check_name}_{timestamp}.csv"
-            filepath = os.path.join(output_dir, filename)
-            failed_df.to_csv(filepath, index=False)
-            print(f"✓ Saved {len(failed_df)} failed records to {filepath}")
+    def write_check(check_name: str) -> Optional[Tuple[int, str]]:
+        failed_df = failed_records_dict[check_name]
+        if len(failed_df) == 0:
+            return None
+        filepath = os.path.join(output_dir, f"failed_{check_name}_{timestamp}.{file_format}")
+        write_failed_records_file(failed_df, filepath, file_format)
+        return len(failed_df), filepath
+    
+    if max_workers <= 1:
+        saved_files = [write_check(check_name) for check_name in check_names]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(check_names))) as executor:
+            futures = [executor.submit(write_check, check_name) for check_name in check_names]
+        saved_files = [future.result() for future in futures]
+    # Logged in submission order once every write has finished
+    for saved in saved_files:
+        if saved is not None:
+            logger.info("✓ Saved %d failed records to %s", *saved)
 
 
-def generate_sample_data(num_records: int = 1000, include_errors: bool = True) -> pd.DataFrame:
+def generate_sample_data(num_records: int = 1000, include_errors: bool = True,
+                         optimize_dtypes: bool = False) -> pd.DataFrame:
     """
     Generate sample transaction data for testing
     
     Args:
         num_records: Number of records to generate
         include_errors: Whether to include some erroneous records for testing
+        optimize_dtypes: Convert columns with optimize_transaction_dtypes, as for
+            loaded data. Currency is then categorical, so assigning a code outside
+            its categories raises a TypeError.
         
     Returns:
         DataFrame with sample transaction data
     """
-    import random
-    import numpy as np
     from datetime import timedelta
     
+    rng = np.random.default_rng()
+    
     # Base data generation
-    transaction_ids = [f"TXN{str(i).zfill(8)}" for i in range(1, num_records + 1)]
-    account_ids = [f"ACC{random.randint(100000, 999999)}" for _ in range(num_records)]
-    amounts = np.random.lognormal(mean=3, sigma=1, size=num_records).round(2)
+    transaction_ids = np.char.mod("TXN%08d", np.arange(1, num_records + 1))
+    account_ids = pd.Series(rng.integers(100000, 1000000, size=num_records)).astype(str).radd("ACC")
+    amounts = rng.lognormal(mean=3, sigma=1, size=num_records).round(2)
     
     # Valid currencies (most records)
     valid_currencies = ["USD", "EUR", "GBP", "JPY", "CAD"]
-    currencies = [random.choice(valid_currencies) for _ in range(num_records)]
+    currencies = rng.choice(valid_currencies, size=num_records)
     
     # Generate timestamps
-    base_time = datetime.now() - timedelta(days=30)
-    timestamps = []
-    for i in range(num_records):
-        random_offset = random.randint(0, 30 * 24 * 60 * 60)  # Up to 30 days
-        timestamp = base_time + timedelta(seconds=random_offset)
-        timestamps.append(timestamp.strftime("%Y-%m-%d %H:%M:%S"))
+    # Offsets are added at second resolution in NumPy, then formatted in one call.
+    # Timestamps stay strings so injected format errors reach the timestamp check.
+    base_time = np.datetime64(datetime.now() - timedelta(days=30), 's')
+    random_offsets = rng.integers(0, 30 * 24 * 60 * 60, size=num_records, endpoint=True)  # Up to 30 days
+    timestamps = pd.DatetimeIndex(base_time + random_offsets.astype('timedelta64[s]')).strftime("%Y-%m-%d %H:%M:%S")
     
     # Create DataFrame
     df = pd.DataFrame({
@@ -103,24 +296,30 @@ def generate_sample_data(num_records: int = 1000, include_errors: bool = True) -
     })
     
     if include_errors:
-        # Introduce some errors for testing
-        error_indices = random.sample(range(num_records), min(50, num_records // 20))
-        
-        for idx in error_indices:
-            error_type = random.choice(['null_field', 'negative_amount', 'invalid_currency', 'duplicate_id', 'invalid_timestamp'])
-            
-            if error_type == 'null_field':
-                field = random.choice(['transaction_id', 'account_id', 'amount', 'currency'])
-                df.loc[idx, field] = None
-            elif error_type == 'negative_amount':
-                df.loc[idx, 'amount'] = -abs(df.loc[idx, 'amount'])
-            elif error_type == 'invalid_currency':
-                df.loc[idx, 'currency'] = 'XXX'
-            elif error_type == 'duplicate_id' and idx > 0:
-                df.loc[idx, 'transaction_id'] = df.loc[idx-1, 'transaction_id']
-            elif error_type == 'invalid_timestamp':
-                df.loc[idx, 'timestamp'] = 'invalid-date'
+        # Introduce some errors for testing, applied as one assignment per error type
+        error_indices = rng.choice(num_records, size=min(50, num_records // 20), replace=False)
+        error_types = rng.choice(['null_field', 'negative_amount', 'invalid_currency', 'duplicate_id', 'invalid_timestamp'],
+                                 size=len(error_indices))
+        
+        null_idx = error_indices[error_types == 'null_field']
+        null_fields = rng.choice(['transaction_id', 'account_id', 'amount', 'currency'], size=len(null_idx))
+        for field in np.unique(null_fields):
+            df.loc[null_idx[null_fields == field], field] = None
+        
+        negative_idx = error_indices[error_types == 'negative_amount']
+        df.loc[negative_idx, 'amount'] = -df.loc[negative_idx, 'amount'].abs().to_numpy()
+        
+        df.loc[error_indices[error_types == 'invalid_currency'], 'currency'] = 'XXX'
+        
+        # Duplicates copy the previous row's ID, so the first row can't be one
+        duplicate_idx = error_indices[(error_types == 'duplicate_id') & (error_indices > 0)]
+        df.loc[duplicate_idx, 'transaction_id'] = df['transaction_id'].to_numpy()[duplicate_idx - 1]
+        
+        df.loc[error_indices[error_types == 'invalid_timestamp'], 'timestamp'] = 'invalid-date'
     
+    if optimize_dtypes:
+        # Match the dtypes of loaded data, so currency is checked by its category codes
+        return optimize_transaction_dtypes(df)
     return df
 
 
@@ -135,15 +334,34 @@ def format_currency(amount: float, currency: str) -> str:
     Returns:
         Formatted currency string
     """
-    currency_symbols = {
-        'USD': '$', 'EUR': '€', 'GBP': '£', 'JPY': '¥',
-        'CAD': 'C$', 'AUD': 'A$', 'CHF': 'CHF'
-    }
-    
-    symbol = currency_symbols.get(currency, currency)
+    symbol = CURRENCY_SYMBOLS.get(currency, currency)
     return f"{symbol}{amount:,.2f}"
 
 
+def format_currency_array(amounts: np.ndarray, currencies: np.ndarray) -> np.ndarray:
+    """
+    Format many amounts with their currency symbols
+    
+    Symbols are looked up once per distinct currency rather than once per amount.
+    
+    Args:
+        amounts: Numeric amounts
+        currencies: Currency codes, one per amount
+        
+    Returns:
+        Array of formatted currency strings, as format_currency would return them;
+        amounts with a missing currency code get no symbol
+    """
+    currencies = pd.Categorical(currencies)
+    symbol_table = np.array([CURRENCY_SYMBOLS.get(code, code) for code in currencies.categories] + [''],
+                            dtype=object)
+    # Missing currency codes (-1) pick the trailing empty symbol
+    symbols = symbol_table[currencies.codes]
+    
+    formatted = np.array([f"{amount:,.2f}" for amount in np.asarray(amounts, dtype=np.float64)], dtype=object)
+    return symbols + formatted
+
+
 def calculate_data_quality_score(validation_results: Dict[str, Dict]) -> float:
     """
     Calculate overall data quality score based on validation results
@@ -167,17 +385,15 @@ def calculate_data_quality_score(validation_results: Dict[str, Dict]) -> float:
         'account_id_format': 0.05
     }
     
-    weighted_score = 0.0
-    total_weight = 0.0
-    
-    for check_name, result in validation_results.items():
-        weight = weights.get(check_name, 0.1)  # Default weight for unknown checks
-        pass_rate = result.get('pass_rate', 0.0)
-        weighted_score += pass_rate * weight
-        total_weight += weight
+    count = len(validation_results)
+    check_weights = np.fromiter((weights.get(check_name, 0.1)  # Default weight for unknown checks
+                                 for check_name in validation_results), dtype=np.float64, count=count)
+    pass_rates = np.fromiter((result.get('pass_rate', 0.0) for result in validation_results.values()),
+                             dtype=np.float64, count=count)
     
+    total_weight = check_weights.sum()
     if total_weight > 0:
-        return (weighted_score / total_weight) * 100
+        return float(np.dot(pass_rates, check_weights) / total_weight * 100)
     else:
         return 0.0
 
@@ -186,17 +402,39 @@ def export_to_excel(data_dict: Dict[str, pd.DataFrame], filename: str):
     """
     Export multiple DataFrames to different sheets in an Excel file
     
+    The workbook is written in openpyxl's write-only mode, which streams rows to
+    the file instead of keeping every cell in memory.
+    
     Args:
         data_dict: Dictionary where keys are sheet names and values are DataFrames
         filename: Output Excel filename
     """
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-        for sheet_name, df in data_dict.items():
-            # Clean sheet name (Excel has restrictions)
-            clean_sheet_name = sheet_name.replace('/', '_').replace('\\', '_')[:31]
-            df.to_excel(writer, sheet_name=clean_sheet_name, index=False)
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    
+    workbook = Workbook(write_only=True)
+    header_font = Font(bold=True)
+    
+    for sheet_name, df in data_dict.items():
+        # Clean sheet name (Excel has restrictions)
+        clean_sheet_name = sheet_name.replace('/', '_').replace('\\', '_')[:31]
+        sheet = workbook.create_sheet(title=clean_sheet_name)
+        
+        header = []
+        for column in df.columns:
+            cell = WriteOnlyCell(sheet, value=str(column))
+            cell.font = header_font
+            header.append(cell)
+        sheet.append(header)
+        
+        # Missing values are left as empty cells
+        for row in df.itertuples(index=False, name=None):
+            sheet.append([None if pd.isna(value) else value for value in row])
+    
+    workbook.save(filename)
     
-    print(f"✓ Exported data to Excel file: {filename}")
+    logger.info("✓ Exported data to Excel file: %s", filename)
 
 
 def get_file_size_mb(filepath: str) -> float:
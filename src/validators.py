@@ -5,43 +5,126 @@ Core validation functions for data quality checks
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional, Callable
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from src.utils import _STRING_DTYPE
 
 
-def validate_non_null_fields(df: pd.DataFrame, mandatory_fields: List[str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+# Arrow-backed strings (when pyarrow is installed) are matched with RE2 (linear
+# time, no backtracking)
+_MATCH_STRING_DTYPE = pd.api.types.pandas_dtype(_STRING_DTYPE)
+
+
+def select_failed_records(df: pd.DataFrame, mask: pd.Series, failure_reason: Any,
+                          failed_fields: Any) -> pd.DataFrame:
     """
-    Validate that mandatory fields are not null
+    Select the rows flagged by a failure mask and annotate why they failed
     
     Args:
         df: Input DataFrame
-        mandatory_fields: List of field names that cannot be null
+        mask: Boolean Series, True for rows that failed the check
+        failure_reason: Scalar reason or Series of per-row reasons aligned to df
+        failed_fields: Scalar field name(s) or Series of per-row fields aligned to df
         
     Returns:
-        Tuple of (passed_records, failed_records)
+        DataFrame of failed records with categorical failure_reason and failed_fields columns
     """
-    mask = df[mandatory_fields].isnull().any(axis=1)
-    failed_records = df[mask].copy()
+    positions = np.flatnonzero(mask.to_numpy(dtype=bool))
+    return select_failed_positions(df, positions,
+                                   take_failure_values(failure_reason, positions),
+                                   take_failure_values(failed_fields, positions))
+
+
+def take_failure_values(values: Any, positions: np.ndarray) -> Any:
+    """
+    Reduce a check's per-row failure annotation to the failing rows
     
-    if len(failed_records) > 0:
-        failed_records['failure_reason'] = 'Missing mandatory field(s)'
-        failed_records['failed_fields'] = df[mask][mandatory_fields].isnull().apply(
-            lambda x: ', '.join(x.index[x]), axis=1
-        )
-    else:
-        # Add columns for consistency even when no failures
-        failed_records = failed_records.reindex(columns=list(failed_records.columns) + ['failure_reason', 'failed_fields'])
+    Args:
+        values: Scalar annotation, or Series of per-row annotations aligned to the input
+        positions: Row positions of the failing rows
+        
+    Returns:
+        Array of the annotations at positions; scalars are returned unchanged
+    """
+    if isinstance(values, pd.Series):
+        # .array keeps categorical reasons as codes instead of materializing strings
+        return values.array.take(positions)
+    return values
+
+
+def select_failed_positions(df: pd.DataFrame, positions: np.ndarray, failure_reason: Any,
+                            failed_fields: Any) -> pd.DataFrame:
+    """
+    Select failed rows by position and annotate why they failed
     
-    passed_records = df[~mask].copy()
+    Args:
+        df: Input DataFrame
+        positions: Row positions of the failed records
+        failure_reason: Scalar reason or per-row reasons for the selected rows (see take_failure_values)
+        failed_fields: Scalar field name(s) or per-row fields for the selected rows
+        
+    Returns:
+        DataFrame of failed records with categorical failure_reason and failed_fields columns
+    """
+    return df.iloc[positions].assign(
+        failure_reason=_failure_column(failure_reason, len(positions)),
+        failed_fields=_failure_column(failed_fields, len(positions))
+    )
+
+
+def _failure_column(values: Any, length: int) -> Any:
+    """
+    Build a failure annotation column for the failing rows
+    
+    Reasons are stored as category codes, so each row holds a small integer and
+    each message is stored once; the strings only appear when records are written.
+    """
+    if values is None or isinstance(values, (pd.api.extensions.ExtensionArray, np.ndarray)):
+        return values
+    return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=[values])
+
+
+def _split_failures(df: pd.DataFrame, mask: pd.Series, failure_reason: Any,
+                    failed_fields: Any) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Split a DataFrame into (passed_records, failed_records) using a failure mask"""
+    failed_records = select_failed_records(df, mask, failure_reason, failed_fields)
+    passed_records = df.loc[~mask]
     
     return passed_records, failed_records
 
 
-def validate_amount_range(df: pd.DataFrame, min_value: float = 0.01, max_value: float = 1000000.00) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def check_non_null_fields(df: pd.DataFrame, mandatory_fields: List[str]) -> Tuple[pd.Series, str, pd.Series]:
     """
-    Validate that amount is within acceptable range
+    Compute the failure mask for the mandatory fields check
+    
+    Args:
+        df: Input DataFrame
+        mandatory_fields: List of field names that cannot be null
+        
+    Returns:
+        Tuple of (failure_mask, failure_reason, failed_fields)
+    """
+    null_matrix = df[mandatory_fields].isnull().to_numpy()
+    failed = null_matrix.any(axis=1)
+    
+    # Join the field names once per distinct combination of nulls; rows store the
+    # combination's category code (passing rows have none)
+    patterns, pattern_codes = np.unique(null_matrix[failed], axis=0, return_inverse=True)
+    codes = np.full(len(df), -1, dtype=np.intp)
+    codes[failed] = pattern_codes.ravel()
+    field_names = np.asarray(mandatory_fields, dtype=object)
+    labels = [', '.join(field_names[pattern]) for pattern in patterns]
+    failed_fields = pd.Series(pd.Categorical.from_codes(codes, categories=labels), index=df.index)
+    
+    return pd.Series(failed, index=df.index), 'Missing mandatory field(s)', failed_fields
+
+
+def check_amount_range(df: pd.DataFrame, min_value: float = 0.01, max_value: float = 1000000.00) -> Tuple[pd.Series, str, str]:
+    """
+    Compute the failure mask for the amount range check
     
     Args:
         df: Input DataFrame
@@ -49,21 +132,193 @@ def validate_amount_range(df: pd.DataFrame, min_value: float = 0.01, max_value:
         max_value: Maximum allowed amount
         
     Returns:
-        Tuple of (passed_records, failed_records)
+        Tuple of (failure_mask, failure_reason, failed_fields)
+    """
+    # A single pass over the raw floats: NaN fails both comparisons, so nulls are
+    # flagged without a separate isnull check
+    amounts = df['amount'].to_numpy(dtype=np.float64, na_value=np.nan)
+    with np.errstate(invalid='ignore'):
+        mask = ~((amounts > 0) & (amounts <= max_value))
+    
+    return pd.Series(mask, index=df.index), f'Amount not in valid range ({min_value} - {max_value})', 'amount'
+
+
+def check_currency_codes(df: pd.DataFrame, approved_currencies: List[str]) -> Tuple[pd.Series, str, str]:
+    """
+    Compute the failure mask for the currency code check
+    
+    Args:
+        df: Input DataFrame
+        approved_currencies: List of approved currency codes
+        
+    Returns:
+        Tuple of (failure_mask, failure_reason, failed_fields)
     """
-    mask = (df['amount'] <= 0) | (df['amount'] > max_value) | df['amount'].isnull()
-    failed_records = df[mask].copy()
+    currency = df['currency']
     
-    if len(failed_records) > 0:
-        failed_records['failure_reason'] = f'Amount not in valid range ({min_value} - {max_value})'
-        failed_records['failed_fields'] = 'amount'
+    if isinstance(currency.dtype, pd.CategoricalDtype):
+        # Test each category once and look rows up by their integer codes;
+        # the extra False entry catches code -1 (null)
+        approved = np.append(currency.cat.categories.isin(approved_currencies), False)
+        mask = pd.Series(~approved[currency.cat.codes.to_numpy()], index=df.index)
     else:
-        # Add columns for consistency even when no failures
-        failed_records = failed_records.reindex(columns=list(failed_records.columns) + ['failure_reason', 'failed_fields'])
+        # Nulls are never in the approved list, so isin already flags them
+        mask = ~currency.isin(approved_currencies)
     
-    passed_records = df[~mask].copy()
+    return mask, f'Currency not in approved list: {approved_currencies}', 'currency'
+
+
+def check_duplicate_transactions(df: pd.DataFrame, id_column: str = 'transaction_id',
+                                 candidates: Optional[pd.Series] = None,
+                                 duplicate_ids: Optional[pd.Index] = None) -> Tuple[pd.Series, str, str]:
+    """
+    Compute the failure mask for the duplicate transaction check
     
-    return passed_records, failed_records
+    Args:
+        df: Input DataFrame
+        id_column: Column name for transaction ID
+        candidates: Optional boolean mask restricting which rows are compared
+        duplicate_ids: Optional precomputed duplicated IDs (e.g. across chunks of a larger dataset)
+        
+    Returns:
+        Tuple of (failure_mask, failure_reason, failed_fields)
+    """
+    if duplicate_ids is not None:
+        mask = df[id_column].isin(duplicate_ids)
+        if candidates is not None:
+            mask &= candidates
+    elif getattr(df[id_column].dtype, 'storage', None) == 'pyarrow':
+        mask = pd.Series(_repeated_ids(df[id_column], candidates), index=df.index)
+    elif candidates is None:
+        # keep=False flags every occurrence in a single hashing pass
+        mask = df[id_column].duplicated(keep=False)
+    else:
+        # Only rows still in play can collide with each other
+        mask = pd.Series(False, index=df.index)
+        mask[candidates] = df.loc[candidates, id_column].duplicated(keep=False).to_numpy()
+    
+    return mask, 'Duplicate transaction ID', id_column
+
+
+def _repeated_ids(ids: pd.Series, candidates: Optional[pd.Series] = None) -> np.ndarray:
+    """
+    Flag IDs occurring more than once (among the candidate rows) by counting factorized codes
+    
+    Arrow strings factorize natively, so this is a single hashing pass that never
+    gathers the candidate rows; object columns are faster with Series.duplicated.
+    """
+    # Nulls get a code too, so repeated nulls are flagged like in duplicated()
+    codes, uniques = pd.factorize(ids, use_na_sentinel=False)
+    if candidates is None:
+        return np.bincount(codes, minlength=len(uniques))[codes] > 1
+    
+    in_play = candidates.to_numpy(dtype=bool)
+    counts = np.bincount(codes[in_play], minlength=len(uniques))
+    return in_play & (counts[codes] > 1)
+
+
+def check_timestamp_format(df: pd.DataFrame, timestamp_format: str = "%Y-%m-%d %H:%M:%S",
+                           max_future_days: int = 1) -> Tuple[pd.Series, pd.Series, str]:
+    """
+    Compute the failure mask for the timestamp check
+    
+    Args:
+        df: Input DataFrame
+        timestamp_format: Expected timestamp format
+        max_future_days: Maximum days in the future allowed
+        
+    Returns:
+        Tuple of (failure_mask, failure_reasons, failed_fields)
+    """
+    null_mask = df['timestamp'].isnull()
+    
+    try:
+        # Unparseable values are coerced to NaT. An explicit ISO-style format already
+        # takes pandas' fast ISO parser; format='ISO8601' would also accept other layouts.
+        parsed_timestamps = pd.to_datetime(df['timestamp'], format=timestamp_format, errors='coerce')
+        parse_fail_mask = parsed_timestamps.isnull() & ~null_mask
+        
+        # NaT never compares greater, so failed parses are not also flagged as future
+        future_threshold = pd.Timestamp.now() + pd.Timedelta(days=max_future_days)
+        future_mask = parsed_timestamps > future_threshold
+        
+        reason_codes = np.select([null_mask, parse_fail_mask, future_mask], [0, 1, 2], default=-1)
+        categories = ['Null timestamp',
+                      f'Invalid timestamp format (expected: {timestamp_format})',
+                      f'Timestamp too far in future (max {max_future_days} days)']
+    except Exception as e:
+        # If parsing completely fails, mark all as failed
+        reason_codes = np.where(null_mask, 0, 1)
+        categories = ['Null timestamp', f'Timestamp parsing error: {str(e)}']
+    
+    # Reasons are categorical so each row stores a small code rather than a string;
+    # rows that pass have no reason (NaN)
+    failure_reasons = pd.Series(pd.Categorical.from_codes(reason_codes, categories=categories), index=df.index)
+    mask = pd.Series(reason_codes >= 0, index=df.index)
+    
+    return mask, failure_reasons, 'timestamp'
+
+
+def check_account_id_format(df: pd.DataFrame, pattern: str = None) -> Tuple[pd.Series, str, str]:
+    """
+    Compute the failure mask for the account ID format check
+    
+    Args:
+        df: Input DataFrame
+        pattern: Regex pattern for account ID validation
+        
+    Returns:
+        Tuple of (failure_mask, failure_reason, failed_fields)
+    """
+    # Cast object and Python-backed string columns once, so patterns run on RE2
+    # whatever the input dtype
+    account_ids = df['account_id']
+    if getattr(account_ids.dtype, 'storage', None) != _MATCH_STRING_DTYPE.storage:
+        account_ids = account_ids.astype(_MATCH_STRING_DTYPE)
+    
+    if pattern is None:
+        # Basic validation - just check for non-empty strings
+        mask = account_ids.str.strip().eq('') | df['account_id'].isnull()
+    else:
+        try:
+            matched = account_ids.str.match(pattern)
+        except ValueError:
+            # RE2 rejects some Python regex features (lookarounds, backreferences),
+            # so those patterns are matched on object strings with the re module
+            matched = df['account_id'].astype(object).str.match(pattern, na=False)
+        mask = ~matched | df['account_id'].isnull()
+    
+    # Nulls are already flagged, so the mask can drop its nullable boolean dtype
+    return mask.astype(bool), 'Invalid account ID format', 'account_id'
+
+
+def validate_non_null_fields(df: pd.DataFrame, mandatory_fields: List[str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Validate that mandatory fields are not null
+    
+    Args:
+        df: Input DataFrame
+        mandatory_fields: List of field names that cannot be null
+        
+    Returns:
+        Tuple of (passed_records, failed_records)
+    """
+    return _split_failures(df, *check_non_null_fields(df, mandatory_fields))
+
+
+def validate_amount_range(df: pd.DataFrame, min_value: float = 0.01, max_value: float = 1000000.00) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Validate that amount is within acceptable range
+    
+    Args:
+        df: Input DataFrame
+        min_value: Minimum allowed amount
+        max_value: Maximum allowed amount
+        
+    Returns:
+        Tuple of (passed_records, failed_records)
+    """
+    return _split_failures(df, *check_amount_range(df, min_value, max_value))
 
 
 def validate_currency_codes(df: pd.DataFrame, approved_currencies: List[str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -77,14 +332,7 @@ def validate_currency_codes(df: pd.DataFrame, approved_currencies: List[str]) ->
     Returns:
         Tuple of (passed_records, failed_records)
     """
-    mask = ~df['currency'].isin(approved_currencies) | df['currency'].isnull()
-    failed_records = df[mask].copy()
-    failed_records['failure_reason'] = f'Currency not in approved list: {approved_currencies}'
-    failed_records['failed_fields'] = 'currency'
-    
-    passed_records = df[~mask].copy()
-    
-    return passed_records, failed_records
+    return _split_failures(df, *check_currency_codes(df, approved_currencies))
 
 
 def validate_duplicate_transactions(df: pd.DataFrame, id_column: str = 'transaction_id') -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -98,14 +346,7 @@ def validate_duplicate_transactions(df: pd.DataFrame, id_column: str = 'transact
     Returns:
         Tuple of (passed_records, failed_records)
     """
-    duplicates_mask = df.duplicated(subset=[id_column], keep=False)
-    failed_records = df[duplicates_mask].copy()
-    failed_records['failure_reason'] = 'Duplicate transaction ID'
-    failed_records['failed_fields'] = id_column
-    
-    passed_records = df[~duplicates_mask].copy()
-    
-    return passed_records, failed_records
+    return _split_failures(df, *check_duplicate_transactions(df, id_column))
 
 
 def validate_timestamp_format(df: pd.DataFrame, timestamp_format: str = "%Y-%m-%d %H:%M:%S", 
@@ -121,89 +362,173 @@ def validate_timestamp_format(df: pd.DataFrame, timestamp_format: str = "%Y-%m-%
     Returns:
         Tuple of (passed_records, failed_records)
     """
-    failed_records_list = []
+    return _split_failures(df, *check_timestamp_format(df, timestamp_format, max_future_days))
+
+
+def validate_account_id_format(df: pd.DataFrame, pattern: str = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Validate account ID format (optional validation)
     
-    # Check for null timestamps
-    null_mask = df['timestamp'].isnull()
-    if null_mask.any():
-        null_failed = df[null_mask].copy()
-        null_failed['failure_reason'] = 'Null timestamp'
-        null_failed['failed_fields'] = 'timestamp'
-        failed_records_list.append(null_failed)
+    Args:
+        df: Input DataFrame
+        pattern: Regex pattern for account ID validation
+        
+    Returns:
+        Tuple of (passed_records, failed_records)
+    """
+    return _split_failures(df, *check_account_id_format(df, pattern))
+
+
+# Validation checks, in the order a failing row is attributed to them
+VALIDATION_CHECKS = [
+    'mandatory_fields', 'amount_range', 'currency_codes',
+    'duplicate_transactions', 'timestamp_format', 'account_id_format'
+]
+
+# Duplicate IDs are only compared among rows passing these checks
+_PRE_DUPLICATE_CHECKS = VALIDATION_CHECKS[:3]
+
+
+def build_checks(validation_rules: Dict[str, Any],
+                 approved_currencies: List[str]) -> Dict[str, Callable[[pd.DataFrame], Tuple[pd.Series, Any, Any]]]:
+    """
+    Build the configured checks that only look at their own columns
     
-    # Work with non-null timestamps
-    non_null_df = df[~null_mask].copy()
+    Args:
+        validation_rules: The "validation_rules" section of the data quality config
+        approved_currencies: List of approved currency codes
+        
+    Returns:
+        Dictionary of check name to check callable; duplicate detection is not
+        included, as it depends on which rows pass the other checks
+    """
+    amount_config = validation_rules["amount_validation"]
+    timestamp_config = validation_rules["timestamp_validation"]
+    account_id_config = validation_rules.get("account_id_validation") or {}
     
-    if len(non_null_df) > 0:
-        try:
-            # Try to parse timestamps
-            parsed_timestamps = pd.to_datetime(non_null_df['timestamp'], format=timestamp_format, errors='coerce')
-            
-            # Check for parsing failures
-            parse_fail_mask = parsed_timestamps.isnull()
-            if parse_fail_mask.any():
-                parse_failed = non_null_df[parse_fail_mask].copy()
-                parse_failed['failure_reason'] = f'Invalid timestamp format (expected: {timestamp_format})'
-                parse_failed['failed_fields'] = 'timestamp'
-                failed_records_list.append(parse_failed)
-            
-            # Check for future dates beyond threshold
-            valid_parsed = non_null_df[~parse_fail_mask].copy()
-            if len(valid_parsed) > 0:
-                valid_timestamps = parsed_timestamps[~parse_fail_mask]
-                future_threshold = datetime.now() + timedelta(days=max_future_days)
-                future_mask = valid_timestamps > future_threshold
-                
-                if future_mask.any():
-                    future_failed = valid_parsed[future_mask].copy()
-                    future_failed['failure_reason'] = f'Timestamp too far in future (max {max_future_days} days)'
-                    future_failed['failed_fields'] = 'timestamp'
-                    failed_records_list.append(future_failed)
-                
-                passed_records = valid_parsed[~future_mask].copy()
-            else:
-                passed_records = pd.DataFrame(columns=df.columns)
-        except Exception as e:
-            # If parsing completely fails, mark all as failed
-            all_failed = non_null_df.copy()
-            all_failed['failure_reason'] = f'Timestamp parsing error: {str(e)}'
-            all_failed['failed_fields'] = 'timestamp'
-            failed_records_list.append(all_failed)
-            passed_records = pd.DataFrame(columns=df.columns)
-    else:
-        passed_records = pd.DataFrame(columns=df.columns)
+    return {
+        "mandatory_fields": partial(check_non_null_fields,
+                                    mandatory_fields=validation_rules["mandatory_fields"]),
+        "amount_range": partial(check_amount_range,
+                                min_value=amount_config["min_value"],
+                                max_value=amount_config["max_value"]),
+        "currency_codes": partial(check_currency_codes,
+                                  approved_currencies=approved_currencies),
+        "timestamp_format": partial(check_timestamp_format,
+                                    timestamp_format=timestamp_config["format"],
+                                    max_future_days=timestamp_config["max_future_days"]),
+        "account_id_format": partial(check_account_id_format,
+                                     pattern=account_id_config.get("pattern"))
+    }
+
+
+def duplicate_candidates(df: pd.DataFrame, validation_rules: Dict[str, Any],
+                         approved_currencies: List[str]) -> np.ndarray:
+    """
+    Flag the rows that reach duplicate detection
+    
+    Args:
+        df: Input DataFrame
+        validation_rules: The "validation_rules" section of the data quality config
+        approved_currencies: List of approved currency codes
+        
+    Returns:
+        Boolean array, True for rows passing every check that runs before duplicate detection
+    """
+    checks = build_checks(validation_rules, approved_currencies)
+    return _passes_checks({name: checks[name](df) for name in _PRE_DUPLICATE_CHECKS}, _PRE_DUPLICATE_CHECKS)
+
+
+def _passes_checks(results: Dict[str, Tuple[pd.Series, Any, Any]], check_names: List[str]) -> np.ndarray:
+    """Flag rows passing every one of the named checks"""
+    return ~np.logical_or.reduce([results[name][0].to_numpy(dtype=bool) for name in check_names])
+
+
+def evaluate_checks(df: pd.DataFrame, validation_rules: Dict[str, Any], approved_currencies: List[str],
+                    duplicate_ids: Optional[pd.Index] = None,
+                    max_workers: int = 1) -> Tuple[np.ndarray, Dict[str, Tuple[pd.Series, Any, Any]]]:
+    """
+    Evaluate every validation check once and code each row by the first check it fails
     
-    # Combine all failed records
-    if failed_records_list:
-        failed_records = pd.concat(failed_records_list, ignore_index=True)
+    The checks are vectorized column predicates, so with max_workers above 1 the
+    independent checks share the frame on worker threads and overlap wherever
+    pandas/NumPy release the GIL.
+    
+    Args:
+        df: Input DataFrame
+        validation_rules: The "validation_rules" section of the data quality config
+        approved_currencies: List of approved currency codes
+        duplicate_ids: Optional precomputed duplicated IDs (e.g. across chunks of a larger dataset)
+        max_workers: Number of threads evaluating the independent checks
+        
+    Returns:
+        Tuple of (codes, check_results): a uint8 code per row, 0 for rows passing
+        every check and otherwise 1 + the index of the first failed check in
+        VALIDATION_CHECKS, and each check's (failure_mask, failure_reason, failed_fields)
+    """
+    checks = build_checks(validation_rules, approved_currencies)
+    
+    if max_workers <= 1 or len(df) == 0:
+        results = {name: check(df) for name, check in checks.items()}
     else:
-        failed_records = pd.DataFrame(columns=df.columns.tolist() + ['failure_reason', 'failed_fields'])
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(checks))) as executor:
+            futures = {name: executor.submit(check, df) for name, check in checks.items()}
+            results = {name: future.result() for name, future in futures.items()}
     
-    return passed_records, failed_records
+    candidates = pd.Series(_passes_checks(results, _PRE_DUPLICATE_CHECKS), index=df.index)
+    results["duplicate_transactions"] = check_duplicate_transactions(df, candidates=candidates,
+                                                                     duplicate_ids=duplicate_ids)
+    
+    # np.select picks the first matching condition, i.e. the first failed check
+    masks = [results[name][0].to_numpy(dtype=bool) for name in VALIDATION_CHECKS]
+    codes = np.select(masks, np.arange(1, len(VALIDATION_CHECKS) + 1, dtype=np.uint8), default=0).astype(np.uint8)
+    
+    return codes, results
 
 
-def validate_account_id_format(df: pd.DataFrame, pattern: str = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def validate_all(df: pd.DataFrame, validation_rules: Dict[str, Any], approved_currencies: List[str],
+                 max_workers: int = 1) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
-    Validate account ID format (optional validation)
+    Run every validation check and split the records once
+    
+    Each row is attributed to the first check it fails, as in DataQualityFramework.
     
     Args:
         df: Input DataFrame
-        pattern: Regex pattern for account ID validation
+        validation_rules: The "validation_rules" section of the data quality config
+        approved_currencies: List of approved currency codes
+        max_workers: Number of threads evaluating the independent checks
         
     Returns:
-        Tuple of (passed_records, failed_records)
+        Tuple of (passed_records, failed_records); failed records carry
+        validation_check, failure_reason and failed_fields columns
     """
-    if pattern is None:
-        # Basic validation - just check for non-empty strings
-        mask = df['account_id'].astype(str).str.strip().eq('') | df['account_id'].isnull()
-    else:
-        import re
-        mask = ~df['account_id'].astype(str).str.match(pattern) | df['account_id'].isnull()
+    codes, results = evaluate_checks(df, validation_rules, approved_currencies, max_workers=max_workers)
+    failed = codes > 0
     
-    failed_records = df[mask].copy()
-    failed_records['failure_reason'] = 'Invalid account ID format'
-    failed_records['failed_fields'] = 'account_id'
+    # Reasons are decoded for the failed rows only, check by check
+    failed_codes = codes[failed]
+    failure_reasons = np.empty(len(failed_codes), dtype=object)
+    failed_fields = np.empty(len(failed_codes), dtype=object)
+    for code, check_name in enumerate(VALIDATION_CHECKS, start=1):
+        rows = failed_codes == code
+        if rows.any():
+            _, failure_reason, fields = results[check_name]
+            check_rows = codes == code
+            failure_reasons[rows] = _row_values(failure_reason, check_rows)
+            failed_fields[rows] = _row_values(fields, check_rows)
     
-    passed_records = df[~mask].copy()
+    failed_records = df.loc[failed].assign(
+        validation_check=pd.Categorical.from_codes(failed_codes.astype(np.int8) - 1, categories=VALIDATION_CHECKS),
+        failure_reason=failure_reasons,
+        failed_fields=failed_fields
+    )
     
-    return passed_records, failed_records
+    return df.loc[~failed], failed_records
+
+
+def _row_values(values: Any, rows: np.ndarray) -> Any:
+    """Select rows of a per-row Series positionally, pass scalars through"""
+    if isinstance(values, pd.Series):
+        return values.to_numpy(dtype=object)[rows]
+    return values
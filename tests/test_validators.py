@@ -7,9 +7,17 @@ import pandas as pd
 import numpy as np
 import sys
 import os
+import pickle
+import re
+import shutil
+import tempfile
+from datetime import date, datetime, time
+from unittest.mock import patch
 
-# Add src directory to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Add the repository root and src directory to path
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(REPO_ROOT)
+sys.path.append(os.path.join(REPO_ROOT, 'src'))
 
 from validators import (
     validate_non_null_fields,
@@ -17,7 +25,25 @@ from validators import (
     validate_currency_codes,
     validate_duplicate_transactions,
     validate_timestamp_format,
-    validate_account_id_format
+    validate_account_id_format,
+    check_duplicate_transactions,
+    check_timestamp_format,
+    validate_all
+)
+from src.data_quality_framework import DataQualityFramework
+from src.report_generator import DataQualityReportGenerator
+from src.utils import (
+    load_config,
+    load_transactions_csv,
+    iter_transactions_csv,
+    format_currency,
+    format_currency_array,
+    export_to_excel,
+    save_failed_records,
+    write_failed_records_file,
+    resolve_failed_records_format,
+    DEFAULT_MAX_WORKERS,
+    PYARROW_AVAILABLE
 )
 
 
@@ -73,7 +99,18 @@ class TestDataQualityValidators(unittest.TestCase):
         self.assertEqual(len(failed_df), 1)
         self.assertEqual(len(passed_df), 4)
         self.assertEqual(failed_df.iloc[0]['currency'], 'XXX')
-    
+
+    def test_validate_currency_codes_categorical(self):
+        """Test currency code validation on a categorical currency column"""
+        data = self.sample_data.copy()
+        data.loc[1, 'currency'] = None
+        data['currency'] = data['currency'].astype('category')
+
+        passed_df, failed_df = validate_currency_codes(data, self.approved_currencies)
+
+        self.assertEqual(failed_df['transaction_id'].tolist(), ['TXN002', 'TXN003'])
+        self.assertEqual(len(passed_df), 3)
+
     def test_validate_duplicate_transactions(self):
         """Test duplicate transaction validation"""
         # Create data with duplicates
@@ -103,6 +140,105 @@ class TestDataQualityValidators(unittest.TestCase):
         self.assertEqual(len(failed_df), 1)
         self.assertEqual(len(passed_df), 4)
     
+    def test_validate_account_id_format_pattern(self):
+        """Test account ID regex validation on a string dtype column"""
+        data = self.sample_data.astype({'account_id': 'string'})
+        
+        passed_df, failed_df = validate_account_id_format(data, pattern=r'ACC\d{3}$')
+        
+        self.assertEqual(len(failed_df), 1)
+        self.assertEqual(len(passed_df), 4)
+        
+        data.loc[0, 'account_id'] = 'ACC12'
+        passed_df, failed_df = validate_account_id_format(data, pattern=r'ACC\d{3}$')
+        self.assertEqual(len(failed_df), 2)
+    
+    def test_validate_account_id_format_python_regex(self):
+        """Test account ID patterns using regex features RE2 does not support"""
+        for dtype in (object, 'string'):
+            data = self.sample_data.astype({'account_id': dtype})
+            
+            passed_df, failed_df = validate_account_id_format(data, pattern=r'(?!ACC123)ACC\d{3}$')
+            self.assertEqual(passed_df['account_id'].tolist(), ['ACC456', 'ACC789'])
+            
+            passed_df, failed_df = validate_account_id_format(data, pattern=r'ACC(\d)\d\1')
+            self.assertEqual(len(passed_df), 0)
+            self.assertEqual(len(failed_df), 5)
+    
+    def test_check_timestamp_format_reasons(self):
+        """Test per-row failure reasons from the timestamp check"""
+        data = pd.DataFrame({
+            'timestamp': ['2025-01-01 10:00:00', None, 'invalid-date', '2999-01-01 00:00:00']
+        })
+        
+        mask, reasons, failed_fields = check_timestamp_format(data)
+        
+        self.assertEqual(mask.tolist(), [False, True, True, True])
+        self.assertEqual(reasons[1], 'Null timestamp')
+        self.assertTrue(reasons[2].startswith('Invalid timestamp format'))
+        self.assertTrue(reasons[3].startswith('Timestamp too far in future'))
+        self.assertEqual(failed_fields, 'timestamp')
+    
+    def test_check_duplicate_transactions_candidates(self):
+        """Test that duplicates are only detected among candidate rows"""
+        data = pd.DataFrame({'transaction_id': ['TXN001', 'TXN001', 'TXN002', 'TXN002']})
+        candidates = pd.Series([True, False, True, True])
+        
+        mask, _, _ = check_duplicate_transactions(data, candidates=candidates)
+        
+        self.assertEqual(mask.tolist(), [False, False, True, True])
+    
+    def test_check_duplicate_transactions_string_dtype(self):
+        """Test duplicate detection on a string dtype ID column"""
+        data = pd.DataFrame({'transaction_id': ['TXN001', 'TXN001', 'TXN002', 'TXN002', None, None, 'TXN003']})
+        data = data.astype({'transaction_id': 'string'})
+        candidates = pd.Series([True, False, True, True, True, True, True])
+        
+        mask, _, _ = check_duplicate_transactions(data)
+        self.assertEqual(mask.tolist(), [True, True, True, True, True, True, False])
+        
+        mask, _, _ = check_duplicate_transactions(data, candidates=candidates)
+        self.assertEqual(mask.tolist(), [False, False, True, True, True, True, False])
+    
+    def test_validate_all_first_failure(self):
+        """Test that validate_all attributes each row to the first check it fails"""
+        data = self.sample_data.copy()
+        data.loc[3, 'amount'] = 10.0
+        data.loc[4, ['amount', 'transaction_id']] = [20.0, 'TXN004']
+        validation_rules = {
+            'mandatory_fields': ['transaction_id', 'account_id', 'amount'],
+            'amount_validation': {'min_value': 0.01, 'max_value': 1000000.00},
+            'timestamp_validation': {'format': '%Y-%m-%d %H:%M:%S', 'max_future_days': 1},
+            'account_id_validation': {'pattern': r'ACC\d{3}$'}
+        }
+        
+        passed_df, failed_df = validate_all(data, validation_rules, self.approved_currencies)
+        
+        self.assertEqual(passed_df['transaction_id'].tolist(), ['TXN001'])
+        self.assertEqual(failed_df['validation_check'].tolist(),
+                         ['amount_range', 'mandatory_fields', 'duplicate_transactions', 'duplicate_transactions'])
+        self.assertEqual(failed_df.loc[2, 'failed_fields'], 'account_id')
+        self.assertEqual(failed_df.loc[3, 'failure_reason'], 'Duplicate transaction ID')
+        
+        data.loc[0, 'account_id'] = 'ACC1'
+        passed_df, failed_df = validate_all(data, validation_rules, self.approved_currencies, max_workers=4)
+        self.assertEqual(len(passed_df), 0)
+        self.assertEqual(failed_df.loc[0, 'validation_check'], 'account_id_format')
+        
+        passed_df, failed_df = validate_all(data.iloc[:0], validation_rules, self.approved_currencies)
+        self.assertEqual(len(passed_df), 0)
+        self.assertEqual(len(failed_df), 0)
+    
+    def test_validators_do_not_modify_input(self):
+        """Test that validators leave the input DataFrame untouched"""
+        original = self.sample_data.copy()
+
+        validate_non_null_fields(self.sample_data, ['transaction_id', 'account_id'])
+        validate_currency_codes(self.sample_data, self.approved_currencies)
+        validate_timestamp_format(self.sample_data)
+
+        pd.testing.assert_frame_equal(self.sample_data, original)
+
     def test_empty_dataframe(self):
         """Test validators with empty DataFrame"""
         empty_df = pd.DataFrame(columns=['transaction_id', 'account_id', 'amount', 'currency', 'timestamp'])
@@ -144,6 +280,445 @@ class TestDataQualityValidators(unittest.TestCase):
         self.assertEqual(len(passed_df), 3)
 
 
+class TestDataQualityFramework(unittest.TestCase):
+    """Test cases for the data quality framework"""
+    
+    def setUp(self):
+        """Set up the framework and test data"""
+        # The framework reads its configuration relative to the repository root
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(REPO_ROOT)
+        
+        self.framework = DataQualityFramework()
+        self.sample_data = pd.DataFrame({
+            'transaction_id': ['TXN001', 'TXN002', 'TXN003', 'TXN004', 'TXN004'],
+            'account_id': ['ACC123', 'ACC456', None, 'ACC789', 'ACC123'],
+            'amount': [100.50, -50.00, 200.75, 10.00, 20.00],
+            'currency': ['USD', 'EUR', 'XXX', 'GBP', 'USD'],
+            'timestamp': ['2025-01-01 10:00:00', '2025-01-02 11:00:00',
+                         'invalid-date', '2025-01-03 12:00:00', '2025-01-04 13:00:00']
+        })
+    
+    def test_run_all_validations_first_failure(self):
+        """Test that each row is attributed to the first check it fails"""
+        results = self.framework.run_all_validations(self.sample_data)
+        
+        self.assertEqual(results["clean_data"]['transaction_id'].tolist(), ['TXN001'])
+        self.assertEqual({name: df.index.tolist() for name, df in results["failed_records"].items()},
+                         {'mandatory_fields': [2], 'amount_range': [1], 'duplicate_transactions': [3, 4]})
+        self.assertEqual(results["failed_records"]['mandatory_fields'].loc[2, 'failed_fields'], 'account_id')
+        self.assertEqual(results["summary_stats"]["total_failed_records"], 4)
+        
+        results = self.framework.run_all_validations(self.sample_data.iloc[:0])
+        self.assertEqual(len(results["clean_data"]), 0)
+        self.assertEqual(results["failed_records"], {})
+    
+    def test_run_all_validations_matches_validate_all(self):
+        """Test that the framework and validate_all attribute failures alike"""
+        self.framework.config["execution"]["max_workers"] = 4
+        results = self.framework.run_all_validations(self.sample_data)
+        
+        passed_df, failed_df = validate_all(self.sample_data, self.framework.config["validation_rules"],
+                                            self.framework.approved_currencies)
+        
+        pd.testing.assert_frame_equal(results["clean_data"], passed_df)
+        self.assertEqual({name: df.index.tolist() for name, df in results["failed_records"].items()},
+                         {name: rows.index.tolist()
+                          for name, rows in failed_df.groupby('validation_check', observed=True)})
+    
+    def test_save_failed_records_materializes_each_check(self):
+        """Test that failed records kept as row positions are written per check"""
+        results = self.framework.run_all_validations(self.sample_data)
+        self.assertIn('amount_range', results["failed_records"])
+        self.assertNotIn('currency_codes', results["failed_records"])
+        
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir)
+        self.framework.save_failed_records(output_dir, file_format="csv")
+        
+        saved = {name.split('_2')[0][len('failed_'):]: pd.read_csv(os.path.join(output_dir, name))
+                 for name in os.listdir(output_dir)}
+        self.assertEqual(saved.keys(), results["failed_records"].keys())
+        for check_name, failed_df in results["failed_records"].items():
+            self.assertEqual(saved[check_name]['transaction_id'].tolist(), failed_df['transaction_id'].tolist())
+            self.assertEqual(saved[check_name]['failure_reason'].tolist(),
+                             failed_df['failure_reason'].astype(str).tolist())
+            self.assertEqual(set(saved[check_name]['validation_check']), {check_name})
+    
+    def _enable_cache(self) -> str:
+        """Enable result caching in a temporary directory and return its path"""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.framework.config["cache"] = {"enabled": True, "directory": cache_dir, "max_entries": 16}
+        return cache_dir
+    
+    def _run_cached(self, df: pd.DataFrame):
+        """Run the validations and return (results, whether the cache was used)"""
+        with self.assertLogs('src.data_quality_framework', level='INFO') as logs:
+            results = self.framework.run_all_validations(df)
+        return results, any('cached' in message for message in logs.output)
+    
+    def _assert_same_failed_records(self, actual, expected):
+        """Compare failed records by check, ignoring when they were validated"""
+        self.assertEqual(actual.keys(), expected.keys())
+        for check_name, failed_df in expected.items():
+            pd.testing.assert_frame_equal(actual[check_name].drop(columns='validation_timestamp'),
+                                          failed_df.drop(columns='validation_timestamp'))
+    
+    def test_cache_hit(self):
+        """Test that a cache hit reproduces the results with a fresh timestamp"""
+        self._enable_cache()
+        
+        # The first run is stamped at midnight, so the cached run's stamps must differ
+        midnight = datetime.combine(date.today(), time()).strftime("%Y-%m-%d %H:%M:%S")
+        with patch('src.data_quality_framework.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime.combine(date.today(), time())
+            first, _ = self._run_cached(self.sample_data)
+        first_failed = dict(first["failed_records"])
+        first_results = dict(first["validation_results"])
+        self.assertEqual(first["summary_stats"]["validation_timestamp"], midnight)
+        
+        second, cached = self._run_cached(self.sample_data)
+        
+        self.assertTrue(cached)
+        self._assert_same_failed_records(second["failed_records"], first_failed)
+        pd.testing.assert_frame_equal(second["clean_data"], first["clean_data"])
+        self.assertEqual(second["validation_results"], first_results)
+        self.assertNotEqual(second["summary_stats"]["validation_timestamp"], midnight)
+        for failed_df in second["failed_records"].values():
+            self.assertNotIn(midnight, failed_df["validation_timestamp"].tolist())
+    
+    def test_cache_expires_with_future_timestamps(self):
+        """Test that cached future-timestamp failures are recomputed once the timestamps are due"""
+        self._enable_cache()
+        data = self.sample_data.copy()
+        future = pd.Timestamp.now().floor('s') + pd.Timedelta(days=3)
+        data.loc[0, 'timestamp'] = future.strftime("%Y-%m-%d %H:%M:%S")
+        
+        first, _ = self._run_cached(data)
+        self.assertEqual(first["failed_records"]["timestamp_format"].index.tolist(), [0])
+        
+        # Still more than max_future_days (1) ahead
+        with patch.object(pd.Timestamp, 'now', return_value=future - pd.Timedelta(days=2)):
+            self.assertTrue(self._run_cached(data)[1])
+            # Results without future timestamps don't expire
+            self._run_cached(self.sample_data)
+        with patch.object(pd.Timestamp, 'now', return_value=future + pd.Timedelta(days=30)):
+            self.assertTrue(self._run_cached(self.sample_data)[1])
+        
+        with patch.object(pd.Timestamp, 'now', return_value=future - pd.Timedelta(hours=12)):
+            results, cached = self._run_cached(data)
+        self.assertFalse(cached)
+        self.assertNotIn('timestamp_format', results["failed_records"])
+        self.assertEqual(results["clean_data"].index.tolist(), [0])
+    
+    def test_cache_miss_after_rules_change(self):
+        """Test that changed validation rules are not served from the cache"""
+        cache_dir = self._enable_cache()
+        self._run_cached(self.sample_data)
+        
+        self.framework.config["validation_rules"]["amount_validation"]["max_value"] = 15.0
+        results, cached = self._run_cached(self.sample_data)
+        
+        self.assertFalse(cached)
+        self.assertEqual(results["failed_records"]["amount_range"].index.tolist(), [0, 1, 4])
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+    
+    def test_cache_corrupt_entry(self):
+        """Test that unreadable cache entries are treated as misses and replaced"""
+        cache_dir = self._enable_cache()
+        expected, _ = self._run_cached(self.sample_data)
+        expected_failed = dict(expected["failed_records"])
+        cache_path = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+        
+        for corrupt in (b'not a pickle', pickle.dumps((1, 2, 3, 4, 5)), pickle.dumps(({}, {'amount_range': 1}))):
+            with open(cache_path, 'wb') as f:
+                f.write(corrupt)
+            
+            results, cached = self._run_cached(self.sample_data)
+            
+            self.assertFalse(cached)
+            self._assert_same_failed_records(results["failed_records"], expected_failed)
+            self.assertEqual(results["summary_stats"]["total_failed_records"], 4)
+            self.assertEqual(self._run_cached(self.sample_data)[1], True)
+    
+    def test_cache_hit_with_changed_index(self):
+        """Test that cached failures are selected with the index of the validated frame"""
+        self._enable_cache()
+        self._run_cached(self.sample_data)
+        
+        shifted = self.sample_data.set_index(self.sample_data.index + 10000)
+        results, cached = self._run_cached(shifted)
+        
+        self.assertTrue(cached)
+        self.assertEqual({name: df.index.tolist() for name, df in results["failed_records"].items()},
+                         {'mandatory_fields': [10002], 'amount_range': [10001],
+                          'duplicate_transactions': [10003, 10004]})
+        pd.testing.assert_frame_equal(results["failed_records"]["amount_range"].iloc[:, :5], shifted.loc[[10001]])
+        self.assertEqual(results["clean_data"].index.tolist(), [10000])
+    
+    def test_run_chunked_validations_matches_single_run(self):
+        """Test that chunked validation matches one run, with duplicates across chunk boundaries"""
+        data = pd.concat([self.sample_data] * 3, ignore_index=True)
+        data['transaction_id'] = [f'TXN{i:03d}' for i in range(len(data))]
+        # Duplicates split by the 4-row chunk boundaries, one also failing another check
+        data.loc[[2, 5], 'transaction_id'] = 'TXNDUP1'
+        data.loc[[3, 9, 14], 'transaction_id'] = 'TXNDUP2'
+        data.loc[[6, 12], 'transaction_id'] = 'TXNDUP3'
+        
+        expected = self.framework.run_all_validations(data)
+        expected_results = dict(expected["validation_results"])
+        expected_failed = dict(expected["failed_records"])
+        
+        results = self.framework.run_chunked_validations(
+            lambda: (data.iloc[start:start + 4] for start in range(0, len(data), 4))
+        )
+        
+        self.assertEqual(results["validation_results"], expected_results)
+        self.assertEqual(results["summary_stats"]["total_failed_records"],
+                         expected["summary_stats"]["total_failed_records"])
+        self.assertEqual(results["failed_records"].keys(), expected_failed.keys())
+        for check_name, failed_df in expected_failed.items():
+            pd.testing.assert_frame_equal(
+                results["failed_records"][check_name].drop(columns='validation_timestamp').astype(str),
+                failed_df.drop(columns='validation_timestamp').astype(str)
+            )
+    
+    @unittest.skipUnless(PYARROW_AVAILABLE, "spilling failed records requires pyarrow")
+    def test_run_chunked_validations_spills_failed_records(self):
+        """Test that chunked runs keep failed records on disk until they are read"""
+        results = self.framework.run_chunked_validations(
+            lambda: (self.sample_data.iloc[start:start + 2] for start in range(0, len(self.sample_data), 2))
+        )
+        failed_records = results["failed_records"]
+        
+        spill_dir = failed_records._spill_dir.name
+        self.assertEqual(sorted(os.listdir(spill_dir)),
+                         ['amount_range_0.feather', 'duplicate_transactions_0.feather',
+                          'duplicate_transactions_1.feather', 'mandatory_fields_0.feather'])
+        self.assertEqual({name: df.index.tolist() for name, df in failed_records.items()},
+                         {'mandatory_fields': [2], 'amount_range': [1], 'duplicate_transactions': [3, 4]})
+        self.assertEqual(failed_records['duplicate_transactions']['failure_reason'].tolist(),
+                         ['Duplicate transaction ID'] * 2)
+        
+        del results, failed_records
+        self.framework.failed_records = {}
+        self.assertFalse(os.path.exists(spill_dir))
+
+
+class TestUtils(unittest.TestCase):
+    """Test cases for utility functions"""
+    
+    def setUp(self):
+        """Set up a temporary directory"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+    
+    def _write_csv(self, rows) -> str:
+        """Write transaction rows to a CSV file and return its path"""
+        file_path = os.path.join(self.temp_dir, 'transactions.csv')
+        with open(file_path, 'w') as f:
+            f.write('transaction_id,account_id,amount,currency,timestamp\n')
+            f.writelines(f'{row}\n' for row in rows)
+        return file_path
+    
+    def test_load_transactions_csv_midnight_timestamps(self):
+        """Test that timestamps which are all midnight keep their time of day"""
+        file_path = self._write_csv(['TXN001,ACC123,10.5,USD,2024-01-01 00:00:00',
+                                     'TXN002,ACC456,20,EUR,2024-01-02 00:00:00'])
+        
+        df = load_transactions_csv(file_path)
+        
+        self.assertEqual(df['timestamp'].tolist(), ['2024-01-01 00:00:00', '2024-01-02 00:00:00'])
+        self.assertFalse(check_timestamp_format(df)[0].any())
+        pd.testing.assert_frame_equal(df, next(iter_transactions_csv(file_path)))
+    
+    def test_load_transactions_csv_keeps_raw_timestamps(self):
+        """Test that a 'T' separator reaches the timestamp check unchanged"""
+        file_path = self._write_csv(['TXN001,ACC123,10.5,USD,2024-01-01T10:00:00',
+                                     'TXN002,ACC456,,,2024-01-02 10:00:00'])
+        
+        df = load_transactions_csv(file_path)
+        
+        self.assertEqual(df['timestamp'].tolist(), ['2024-01-01T10:00:00', '2024-01-02 10:00:00'])
+        self.assertEqual(check_timestamp_format(df)[0].tolist(), [True, False])
+        pd.testing.assert_frame_equal(df, next(iter_transactions_csv(file_path)))
+    
+    def test_save_failed_records_worker_counts(self):
+        """Test that serial and pooled writes save the same non-empty checks"""
+        failed_records = {
+            'amount_range': pd.DataFrame({'transaction_id': ['TXN001'], 'failure_reason': ['Negative amount']}),
+            'currency_codes': pd.DataFrame({'transaction_id': ['TXN002', 'TXN003'],
+                                            'failure_reason': ['Invalid currency code'] * 2}),
+            'timestamp_format': pd.DataFrame({'transaction_id': [], 'failure_reason': []})
+        }
+        
+        for max_workers in (1, DEFAULT_MAX_WORKERS):
+            output_dir = os.path.join(self.temp_dir, str(max_workers))
+            with self.assertLogs('src.utils', level='INFO') as logs:
+                save_failed_records(failed_records, output_dir, file_format="csv", max_workers=max_workers)
+            
+            saved = sorted(os.listdir(output_dir))
+            self.assertEqual([name.split('_2')[0] for name in saved], ['failed_amount_range', 'failed_currency_codes'])
+            self.assertEqual(len(logs.output), 2)
+            self.assertEqual(pd.read_csv(os.path.join(output_dir, saved[1]))['transaction_id'].tolist(),
+                             ['TXN002', 'TXN003'])
+    
+    def _failed_records_frame(self) -> pd.DataFrame:
+        """Failed records with the categorical columns the framework adds"""
+        codes = np.zeros(3, dtype=np.int8)
+        return pd.DataFrame({
+            'transaction_id': pd.array(['TXN001', 'TXN002', 'TXN003'], dtype='string'),
+            'amount': [-1.0, 0.0, np.nan],
+            'failure_reason': pd.Categorical(['Negative amount', 'Zero amount', 'Negative amount']),
+            'failed_fields': pd.Categorical.from_codes(codes, categories=['amount']),
+            'validation_check': pd.Categorical.from_codes(codes, categories=['amount_range']),
+            'validation_timestamp': pd.Categorical.from_codes(codes, categories=['2025-01-01 10:00:00'])
+        }, index=[7, 3, 12])
+    
+    def test_write_failed_records_file_round_trip(self):
+        """Test that each failed records format reads back with its categorical columns"""
+        failed_df = self._failed_records_frame()
+        expected = failed_df.reset_index(drop=True)
+        formats = ("parquet", "feather", "csv") if PYARROW_AVAILABLE else ("csv",)
+        
+        for file_format in formats:
+            self.assertEqual(resolve_failed_records_format(file_format), file_format)
+            filepath = os.path.join(self.temp_dir, f'failed.{file_format}')
+            # A small buffer makes the CSV writer flush several times
+            write_failed_records_file(failed_df, filepath, file_format, buffering=16)
+            
+            if file_format == "csv":
+                actual = pd.read_csv(filepath)
+                self.assertEqual(actual['failure_reason'].tolist(), expected['failure_reason'].tolist())
+                self.assertEqual(actual['failed_fields'].tolist(), ['amount'] * 3)
+                self.assertEqual(actual['validation_check'].tolist(), ['amount_range'] * 3)
+                pd.testing.assert_series_equal(actual['amount'], expected['amount'])
+                continue
+            
+            if file_format == "parquet":
+                import pyarrow.parquet as pq
+                column = pq.ParquetFile(filepath).metadata.row_group(0).column(0)
+                self.assertEqual(column.compression, 'ZSTD')
+                actual = pd.read_parquet(filepath)
+            else:
+                actual = pd.read_feather(filepath)
+            # Categorical columns come back with their categories
+            pd.testing.assert_frame_equal(actual, expected)
+    
+    def test_resolve_failed_records_format(self):
+        """Test format validation and the CSV fallback without pyarrow"""
+        with self.assertRaises(ValueError):
+            resolve_failed_records_format("xlsx")
+        
+        with patch('src.utils.PYARROW_AVAILABLE', False):
+            for file_format in ("parquet", "feather"):
+                with self.assertLogs('src.utils', level='WARNING'):
+                    self.assertEqual(resolve_failed_records_format(file_format), "csv")
+            self.assertEqual(resolve_failed_records_format("csv"), "csv")
+    
+    def test_format_currency_array(self):
+        """Test that batch formatting matches format_currency row by row"""
+        amounts = np.array([1234.5, -2.0, np.nan, 1e6, 0.005, 42.0])
+        currencies = np.array(['USD', 'XXX', 'EUR', 'JPY', 'CHF', 'USD'])
+        
+        formatted = format_currency_array(amounts, currencies)
+        
+        self.assertEqual(formatted.tolist(),
+                         [format_currency(amount, currency) for amount, currency in zip(amounts, currencies)])
+        self.assertEqual(formatted[2], '€nan')
+        self.assertEqual(format_currency_array([1.0], [None]).tolist(), ['1.00'])
+        self.assertEqual(len(format_currency_array(np.array([]), np.array([], dtype=str))), 0)
+    
+    def test_export_to_excel_round_trip(self):
+        """Test that exported sheets read back with the same values"""
+        summary = pd.DataFrame({'check': ['amount_range', 'currency_codes'], 'failed': [3, 0]})
+        failed = pd.DataFrame({'transaction_id': ['TXN001', 'TXN002'], 'amount': [-5.0, np.nan]})
+        filename = os.path.join(self.temp_dir, 'report.xlsx')
+        
+        export_to_excel({'Summary': summary, 'failed/amount': failed}, filename)
+        sheets = pd.read_excel(filename, sheet_name=None)
+        
+        self.assertEqual(list(sheets), ['Summary', 'failed_amount'])
+        pd.testing.assert_frame_equal(sheets['Summary'], summary, check_dtype=False)
+        pd.testing.assert_frame_equal(sheets['failed_amount'], failed, check_dtype=False)
+    
+    def test_load_config_reloads_changed_file(self):
+        """Test that cached configuration is reloaded when the file changes"""
+        config_path = os.path.join(self.temp_dir, 'config.json')
+        with open(config_path, 'w') as f:
+            f.write('{"max_workers": 1}')
+        
+        config = load_config(config_path)
+        config["max_workers"] = 99
+        self.assertEqual(load_config(config_path), {"max_workers": 1})
+        
+        with open(config_path, 'w') as f:
+            f.write('{"max_workers": 4}')
+        # Move the modification time forward in case the rewrite landed in the same tick
+        mtime = os.path.getmtime(config_path) + 10
+        os.utime(config_path, (mtime, mtime))
+        
+        self.assertEqual(load_config(config_path), {"max_workers": 4})
+
+
+class TestReportGenerator(unittest.TestCase):
+    """Test cases for the weekly report"""
+    
+    def setUp(self):
+        """Validate sample data and set up a report directory"""
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(REPO_ROOT)
+        
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir)
+        self.generator = DataQualityReportGenerator(self.output_dir, chart_dpi=20)
+        self.results = DataQualityFramework().run_all_validations(pd.DataFrame({
+            'transaction_id': ['TXN001', 'TXN002', 'TXN003', 'TXN004', 'TXN004'],
+            'account_id': ['ACC123', 'ACC456', None, 'ACC789', 'ACC123'],
+            'amount': [100.50, -50.00, 200.75, 10.00, 20.00],
+            'currency': ['USD', 'EUR', 'XXX', 'GBP', 'USD'],
+            'timestamp': ['2025-01-01 10:00:00', '2025-01-02 11:00:00',
+                         'invalid-date', '2025-01-03 12:00:00', '2025-01-04 13:00:00']
+        }))
+    
+    @unittest.skipUnless(PYARROW_AVAILABLE, "Parquet reports require pyarrow")
+    def test_weekly_parquet_report_round_trip(self):
+        """Test that every sheet of a Parquet report reads back and is linked from the HTML index"""
+        report_path = self.generator.generate_weekly_report(self.results, week_start=datetime(2025, 1, 6),
+                                                            report_format="parquet")
+        
+        self.assertTrue(report_path.endswith('.html'))
+        with open(report_path, encoding='utf-8') as f:
+            html = f.read()
+        report_name = os.path.basename(report_path)[:-len('.html')]
+        self.assertTrue(report_name.startswith('Weekly_DQ_Report_20250106_'))
+        self.assertIn('2025-01-06 to 2025-01-12', html)
+        
+        # The index links each sheet's file, saved next to it
+        sheet_names = ["Summary", "Validation_Details", "Failed_Records_Summary", "Trends"]
+        self.assertEqual(re.findall(r'<a href="([^"]+)"', html),
+                         [f"{report_name}_{sheet_name}.parquet" for sheet_name in sheet_names])
+        sheets = {sheet_name: pd.read_parquet(os.path.join(self.output_dir, f"{report_name}_{sheet_name}.parquet"))
+                  for sheet_name in sheet_names}
+        
+        summary = sheets["Summary"].set_index("Metric")["Value"]
+        self.assertIn(f"<strong>Generated:</strong> {summary['Report Generation Date']}", html)
+        self.assertEqual(summary['Total Failed Records'], '4')
+        self.assertEqual(summary['Checks Performed'],
+                         ", ".join(self.results["summary_stats"]["checks_performed"]))
+        
+        pd.testing.assert_frame_equal(sheets["Validation_Details"],
+                                      self.generator._create_validation_details_sheet(self.results))
+        pd.testing.assert_frame_equal(sheets["Trends"], self.generator._create_trends_sheet(self.results))
+        failed_summary = sheets["Failed_Records_Summary"]
+        pd.testing.assert_frame_equal(failed_summary, self.generator._create_failed_records_summary(self.results))
+        self.assertEqual(dict(zip(failed_summary["Validation_Check"], failed_summary["Failed_Count"])),
+                         {'Mandatory Fields': 1, 'Amount Range': 1, 'Duplicate Transactions': 2})
+        
+        self.assertTrue(any(name.startswith('DQ_Charts_20250106_') for name in os.listdir(self.output_dir)))
+
+
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and error conditions"""
     